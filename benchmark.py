@@ -0,0 +1,434 @@
+"""
+Benchmark harness for the daily solutions.
+
+Each case imports a day's entry point, points it at an input file and runs it
+several times, recording wall time, CPU time and peak memory. Results can be
+written as JSON/CSV and compared against a stored JSON baseline so slowdowns
+show up straight away.
+
+Usage:
+    python benchmark.py                          # every day, dayNN/input.txt
+    python benchmark.py 06 07 05 --repeat 5
+    python benchmark.py 06 --input big_map.txt --json report.json
+    python benchmark.py --baseline baseline.json --tolerance 0.15
+    python benchmark.py 06 07 --sweep 100,200,400,800 --csv scaling.csv
+    python benchmark.py 06-parallel --input big_map.txt --workers 1,2,4,8,16,32
+"""
+import argparse
+import contextlib
+import csv
+import functools
+import importlib
+import io
+import json
+import math
+import os
+import runpy
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+import generate_input
+from grid import grid_shape
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# target is either "package.module:function" or the path of a script that only
+# runs at module level. Solutions read "input.txt" from the working directory
+# (or stdin when stdin=True), so each case runs inside a scratch directory.
+# kwargs are passed to the entry point; cases that take "workers" can be
+# swept over worker counts with --workers.
+Case = namedtuple("Case", ["name", "day", "target", "stdin", "kwargs"], defaults=(None,))
+
+# Days whose input is a character grid; their reports include peak memory
+# per map cell.
+GRID_DAYS = {"04", "06", "08", "10", "12"}
+
+CASES = [
+    Case("01", "01", "day01.solution:solve", False),
+    Case("01-counter", "01", "day01.solution:solve", False, {"engine": "counter"}),
+    Case("01-external", "01", "day01.solution:solve", False, {"engine": "external", "run_size": 100_000}),
+    Case("02", "02", "day02.solution:solve", False),
+    Case("02-report", "02", "day02.solution:solve", False, {"engine": "report"}),
+    Case("03", "03", "day03.solution:solve", False),
+    Case("03-parallel", "03", "day03.solution:solve", False, {"workers": os.cpu_count()}),
+    Case("04", "04", "day04.solution:main", False),
+    Case("04-words", "04", "day04.solution:main", False, {"part": 1}),
+    Case("04-parallel", "04", "day04.solution:main", False, {"workers": os.cpu_count()}),
+    Case("05", "05", "day05.solution:main", False),
+    Case("06", "06", "day06.solution:main", False),
+    Case("06-parallel", "06", "day06.solution:main", False, {"workers": os.cpu_count()}),
+    Case("07", "07", "day07.solution:main", False),
+    Case("07-parallel", "07", "day07.solution:main", False, {"workers": os.cpu_count()}),
+    Case("08", "08", "day08.solution:main", False),
+    Case("09", "09", "day09.solution:main", False),
+    Case("09-blocks", "09", "day09.solution:main", False, {"part": 1}),
+    Case("10", "10", "day10.solution:main", False),
+    Case("10-array", "10", "day10.solution:main", False, {"engine": "array"}),
+    Case("10-reference", "10", "day10.solution:main", False, {"engine": "recursive"}),
+    Case("11", "11", "day11.solution:main", False),
+    Case("11-step", "11", "day11.solution:main", False,
+         {"blink_counts": (1000,), "modulus": 2**31 - 1, "method": "step"}),
+    Case("11-square", "11", "day11.solution:main", False,
+         {"blink_counts": (1000,), "modulus": 2**31 - 1, "method": "square"}),
+    Case("12", "12", "day12.solution:main", False),
+    Case("12-stream", "12", "day12.solution:main", False, {"stream": True}),
+    Case("13", "13", "day13.solution:main_part_two", True),
+    Case("13-reference", "13", "day13.solution:main_part_two", True, {"engine": "machine"}),
+    Case("14", "14", "day14.solution:main", False),
+    Case("14-reference", "14", "day14.solution:main", False, {"engine": "tuple"}),
+    Case("14-scan", "14", "day14.solution:main", False, {"scan": True}),
+]
+
+
+def resolve(case):
+    """
+    Returns a zero-argument callable that runs the case's entry point.
+    """
+    if ":" in case.target:
+        module_name, function_name = case.target.split(":")
+        module = importlib.import_module(module_name)
+        return functools.partial(getattr(module, function_name), **(case.kwargs or {}))
+    script = os.path.join(ROOT, case.target)
+    return lambda: runpy.run_path(script, run_name="__main__")
+
+
+@contextlib.contextmanager
+def prepared_workdir(input_path):
+    """
+    Changes into a scratch directory whose input.txt is the given input.
+    """
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as workdir:
+        target = os.path.join(workdir, "input.txt")
+        try:
+            os.symlink(os.path.abspath(input_path), target)
+        except OSError:
+            shutil.copyfile(input_path, target)
+        os.chdir(workdir)
+        try:
+            yield target
+        finally:
+            os.chdir(previous)
+
+
+def run_once(entry, input_file, use_stdin):
+    """
+    Runs the entry point once and returns (wall, cpu, captured stdout).
+    """
+    output = io.StringIO()
+    with open(input_file) as stdin, contextlib.redirect_stdout(output):
+        saved_stdin = sys.stdin
+        if use_stdin:
+            sys.stdin = stdin
+        try:
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            entry()
+            cpu = time.process_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+        finally:
+            sys.stdin = saved_stdin
+    return wall, cpu, output.getvalue()
+
+
+def measure_peak_memory(entry, input_file, use_stdin):
+    """
+    Runs the entry point under tracemalloc and returns the peak in bytes.
+    Done as a separate run so tracing overhead doesn't skew the timings.
+    Allocations made by worker processes are not included.
+    """
+    tracemalloc.start()
+    try:
+        run_once(entry, input_file, use_stdin)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark_case(case, input_path, repeat, warmup, memory):
+    """
+    Benchmarks a single case and returns its result record.
+    """
+    entry = resolve(case)
+    walls, cpus = [], []
+    with prepared_workdir(input_path) as input_file:
+        for _ in range(warmup):
+            run_once(entry, input_file, case.stdin)
+        for _ in range(repeat):
+            wall, cpu, output = run_once(entry, input_file, case.stdin)
+            walls.append(wall)
+            cpus.append(cpu)
+        peak = measure_peak_memory(entry, input_file, case.stdin) if memory else None
+
+    cells = None
+    if case.day in GRID_DAYS:
+        rows, cols = grid_shape(input_path)
+        cells = rows * cols
+
+    return {
+        "case": case.name,
+        "day": case.day,
+        "kwargs": case.kwargs,
+        "input": os.path.abspath(input_path),
+        "input_bytes": os.path.getsize(input_path),
+        "repeat": repeat,
+        "wall_min": min(walls),
+        "wall_median": statistics.median(walls),
+        "wall_mean": statistics.fmean(walls),
+        "wall_stdev": statistics.stdev(walls) if len(walls) > 1 else 0.0,
+        "cpu_median": statistics.median(cpus),
+        "peak_memory": peak,
+        "cells": cells,
+        "memory_per_cell": peak / cells if peak is not None and cells else None,
+        "output": output.strip(),
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    Compares results against a baseline report.
+    Returns a list of (case, ratio, status) rows where status is one of
+    "ok", "faster", "SLOWER" or "OUTPUT CHANGED".
+    """
+    previous = {record["case"]: record for record in baseline["results"]}
+    rows = []
+    for record in results:
+        old = previous.get(record["case"])
+        if old is None:
+            continue
+        ratio = record["wall_median"] / old["wall_median"] if old["wall_median"] else float("inf")
+        if old.get("input_bytes") == record["input_bytes"] and old.get("output") != record["output"]:
+            status = "OUTPUT CHANGED"
+        elif ratio > 1 + tolerance:
+            status = "SLOWER"
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((record["case"], ratio, status))
+    return rows
+
+
+def write_json(path, results, metadata):
+    with open(path, "w") as f:
+        json.dump({"metadata": metadata, "results": results}, f, indent=2)
+
+
+def write_csv(path, results):
+    fields = ["case", "day", "size", "workers", "input", "input_bytes", "repeat", "wall_min",
+              "wall_median", "wall_mean", "wall_stdev", "cpu_median", "peak_memory", "cells",
+              "memory_per_cell", "speedup", "output"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def scaling_exponent(points):
+    """
+    Least-squares slope of log(time) against log(size), i.e. the k in
+    time ~ size^k. Returns None with fewer than two usable points.
+    """
+    points = [(math.log(size), math.log(wall)) for size, wall in points if size > 0 and wall > 0]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def run_sweep(cases, sizes, seed, repeat, warmup, memory):
+    """
+    Benchmarks every case on generated inputs of each size.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="aoc-sweep-") as scratch:
+        for case in cases:
+            for size in sizes:
+                input_path = os.path.join(scratch, f"day{case.day}-{size}.txt")
+                if not os.path.exists(input_path):
+                    with open(input_path, "w") as f:
+                        f.write(generate_input.generate(case.day, size, seed))
+                record = benchmark_case(case, input_path, repeat, warmup, memory)
+                record["size"] = size
+                record["input"] = f"generated:day{case.day}:size={size}:seed={seed}"
+                results.append(record)
+                print(f"{case.name} size={size}: {record['wall_median']:.4f}s", file=sys.stderr)
+    return results
+
+
+def run_worker_scaling(cases, worker_counts, input_for, repeat, warmup):
+    """
+    Benchmarks the cases that accept "workers" at each worker count and adds
+    the speedup and parallel efficiency relative to the first count.
+    """
+    results = []
+    for case in cases:
+        if "workers" not in (case.kwargs or {}):
+            continue
+        input_path = input_for(case)
+        if not os.path.exists(input_path):
+            print(f"Skipping {case.name}: {input_path} not found", file=sys.stderr)
+            continue
+        reference = None
+        for workers in worker_counts:
+            variant = case._replace(name=f"{case.name}:w{workers}",
+                                    kwargs={**case.kwargs, "workers": workers})
+            record = benchmark_case(variant, input_path, repeat, warmup, memory=False)
+            record["size"] = None
+            record["workers"] = workers
+            reference = reference or record["wall_median"]
+            record["speedup"] = reference / record["wall_median"]
+            record["efficiency"] = record["speedup"] * worker_counts[0] / workers
+            results.append(record)
+    return results
+
+
+def print_worker_scaling(results):
+    print()
+    print(f"{'case':<20}{'workers':>8}{'speedup':>10}{'efficiency':>12}")
+    for r in results:
+        print(f"{r['case']:<20}{r['workers']:>8}{r['speedup']:>9.2f}x{r['efficiency']:>11.0%}")
+
+
+def print_scaling(results):
+    by_case = {}
+    for record in results:
+        by_case.setdefault(record["case"], []).append((record["size"], record["wall_median"]))
+    print()
+    print(f"{'case':<12}{'sizes':>24}  time ~ size^k")
+    for name, points in by_case.items():
+        exponent = scaling_exponent(points)
+        sizes = ",".join(str(size) for size, _ in points)
+        print(f"{name:<12}{sizes:>24}  k = {exponent:.2f}" if exponent is not None
+              else f"{name:<12}{sizes:>24}  k = -")
+
+
+def plot_scaling(results, path):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; skipping --plot", file=sys.stderr)
+        return
+    by_case = {}
+    for record in results:
+        by_case.setdefault(record["case"], []).append((record["size"], record["wall_median"]))
+    fig, ax = plt.subplots()
+    for name, points in by_case.items():
+        ax.loglog(*zip(*points), marker="o", label=name)
+    ax.set_xlabel("input size")
+    ax.set_ylabel("median wall time (s)")
+    ax.legend()
+    fig.savefig(path)
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
+        n /= 1024
+
+
+def print_table(results):
+    print(f"{'case':<12}{'size':>10}{'wall median':>14}{'wall min':>12}{'cpu median':>12}{'peak mem':>14}"
+          f"{'mem/cell':>12}")
+    for r in results:
+        per_cell = r.get("memory_per_cell")
+        per_cell = f"{per_cell:.1f} B" if per_cell is not None else "-"
+        print(f"{r['case']:<12}{r.get('size') or '-':>10}{r['wall_median']:>13.4f}s{r['wall_min']:>11.4f}s"
+              f"{r['cpu_median']:>11.4f}s{format_bytes(r['peak_memory']):>14}{per_cell:>12}")
+
+
+def select_cases(names):
+    if not names:
+        return CASES
+    selected = [case for case in CASES if case.name in names or case.day in names]
+    unknown = set(names) - {case.name for case in selected} - {case.day for case in selected}
+    if unknown:
+        raise SystemExit(f"Unknown case(s): {', '.join(sorted(unknown))}")
+    return selected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the daily solutions.")
+    parser.add_argument("cases", nargs="*", help="case names or day numbers (default: all)")
+    parser.add_argument("--input", help="input file (default: dayNN/input.txt)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--warmup", type=int, default=0, help="untimed runs before timing")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory run")
+    parser.add_argument("--json", help="write a JSON report to this path")
+    parser.add_argument("--csv", help="write a CSV report to this path")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="relative slowdown allowed before flagging (default: 0.10)")
+    parser.add_argument("--sweep", help="comma-separated sizes to run on generated inputs")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    parser.add_argument("--plot", help="with --sweep, save a log-log scaling plot (needs matplotlib)")
+    parser.add_argument("--workers", help="comma-separated worker counts for parallel cases")
+    args = parser.parse_args(argv)
+
+    cases = select_cases(args.cases)
+    if args.workers:
+        worker_counts = [int(n) for n in args.workers.split(",")]
+        input_for = lambda case: args.input or os.path.join(ROOT, f"day{case.day}", "input.txt")
+        results = run_worker_scaling(cases, worker_counts, input_for, args.repeat, args.warmup)
+    elif args.sweep:
+        sizes = [int(size) for size in args.sweep.split(",")]
+        results = run_sweep(cases, sizes, args.seed, args.repeat, args.warmup, not args.no_memory)
+    else:
+        results = []
+        for case in cases:
+            input_path = args.input or os.path.join(ROOT, f"day{case.day}", "input.txt")
+            if not os.path.exists(input_path):
+                print(f"Skipping {case.name}: {input_path} not found", file=sys.stderr)
+                continue
+            record = benchmark_case(case, input_path, args.repeat, args.warmup, not args.no_memory)
+            record["size"] = None
+            results.append(record)
+
+    print_table(results)
+    if args.workers:
+        print_worker_scaling(results)
+    if args.sweep:
+        print_scaling(results)
+        if args.plot:
+            plot_scaling(results, args.plot)
+
+    metadata = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    if args.json:
+        write_json(args.json, results, metadata)
+    if args.csv:
+        write_csv(args.csv, results)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare_with_baseline(results, baseline, args.tolerance)
+        print()
+        print(f"{'case':<12}{'vs baseline':>14}  status")
+        for name, ratio, status in rows:
+            print(f"{name:<12}{ratio:>13.2f}x  {status}")
+        if any(status in ("SLOWER", "OUTPUT CHANGED") for _, _, status in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,188 @@
+import argparse
+import heapq
+import os
+import tempfile
+from array import array
 from collections import Counter
+from itertools import groupby
 
-def solve():
-    # Read the input file
-    with open("input.txt") as file:
-        lines = file.readlines()
-    
+try:
+    import numpy as np
+except ImportError:  # the Counter and external-memory paths work without it
+    np = None
+
+# Numbers per sorted run in external-memory mode (two runs per block of
+# lines, one per column)
+RUN_SIZE = 1_000_000
+
+def read_lists(filename):
     # Parse the two lists
     left_list = []
     right_list = []
-    for line in lines:
-        left, right = map(int, line.split())
-        left_list.append(left)
-        right_list.append(right)
-    
+    with open(filename) as file:
+        for line in file:
+            if line.strip():
+                left, right = map(int, line.split())
+                left_list.append(left)
+                right_list.append(right)
+    return left_list, right_list
+
+def similarity_counter(left_list, right_list):
     # Count occurrences in the right list
     right_count = Counter(right_list)
-    
+
     # Calculate the similarity score
     similarity_score = 0
     for num in left_list:
         similarity_score += num * right_count.get(num, 0)
-    
-    # Print the result
-    print(f"Similarity score: {similarity_score}")
+    return similarity_score
 
-if __name__ == "__main__":
-    solve()
+def total_distance_lists(left_list, right_list):
+    return sum(abs(a - b) for a, b in zip(sorted(left_list), sorted(right_list)))
+
+def load_columns(filename):
+    """
+    Loads both columns straight into int64 arrays with one np.fromstring
+    call over the whole file. Returns (left, right).
+    """
+    with open(filename) as file:
+        values = np.fromstring(file.read(), dtype=np.int64, sep=' ')
+    pairs = values.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+def total_distance_array(left, right):
+    """
+    Sum of the distances between the i-th smallest numbers of each list.
+    """
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+def similarity_array(left, right):
+    """
+    Similarity score: each left number times its count in the right list.
+    The right list is reduced to sorted unique values with counts, and
+    every left number finds its count with one searchsorted.
+    """
+    values, counts = np.unique(right, return_counts=True)
+    if len(values) == 0:
+        return 0
+    idx = np.searchsorted(values, left)
+    idx[idx == len(values)] = 0
+    found = values[idx] == left
+    return int((left[found] * counts[idx[found]]).sum())
+
+def write_sorted_runs(filename, directory, run_size=RUN_SIZE):
+    """
+    External-memory pass one: reads the file run_size lines at a time,
+    sorts each column of the block and writes it as a binary run.
+    Returns (left run paths, right run paths).
+    """
+    left_runs, right_runs = [], []
 
+    def flush(left, right):
+        for column, runs in ((left, left_runs), (right, right_runs)):
+            path = os.path.join(directory, f"run{len(left_runs) + len(right_runs)}.bin")
+            with open(path, "wb") as out:
+                array('q', sorted(column)).tofile(out)
+            runs.append(path)
 
+    left, right = array('q'), array('q')
+    with open(filename) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            a, b = line.split()
+            left.append(int(a))
+            right.append(int(b))
+            if len(left) == run_size:
+                flush(left, right)
+                left, right = array('q'), array('q')
+    if left:
+        flush(left, right)
+    return left_runs, right_runs
+
+def iter_run(path, block=1 << 16):
+    """
+    Yields the numbers of a run file, reading block numbers at a time.
+    """
+    with open(path, "rb") as file:
+        while True:
+            numbers = array('q')
+            try:
+                numbers.fromfile(file, block)
+            except EOFError:
+                pass  # the final, partial block is still read
+            if not numbers:
+                return
+            yield from numbers
+
+def merged(runs):
+    return heapq.merge(*(iter_run(path) for path in runs))
+
+def similarity_sorted(left_sorted, right_sorted):
+    """
+    Similarity score from both lists in sorted order, as a merge join of
+    their runs of equal numbers.
+    """
+    right_groups = groupby(right_sorted)
+    right_value, right_group = next(right_groups, (None, ()))
+    score = 0
+    for value, group in groupby(left_sorted):
+        while right_value is not None and right_value < value:
+            right_value, right_group = next(right_groups, (None, ()))
+        if right_value == value:
+            score += value * sum(1 for _ in right_group) * sum(1 for _ in group)
+    return score
+
+def external_scores(filename, run_size=RUN_SIZE, directory=None):
+    """
+    Returns (total distance, similarity score) for lists too big for RAM.
+    Each column is sorted in runs of run_size numbers written to temporary
+    files, and the runs are k-way merged with heapq.merge: once zipped
+    against each other for the distance and once as a merge join for the
+    similarity. Memory is one run while sorting and one block per run
+    while merging.
+    """
+    with tempfile.TemporaryDirectory(prefix="day01-runs-", dir=directory) as scratch:
+        left_runs, right_runs = write_sorted_runs(filename, scratch, run_size)
+        distance = sum(abs(a - b) for a, b in zip(merged(left_runs), merged(right_runs)))
+        similarity = similarity_sorted(merged(left_runs), merged(right_runs))
+    return distance, similarity
+
+def solve(filename="input.txt", part=2, engine=None, run_size=RUN_SIZE):
+    """
+    Prints the total distance (part 1) or the similarity score (part 2).
+    engine is "array" (NumPy bulk load), "counter" (Python lists) or
+    "external" (sorted runs on disk); by default the array engine is used
+    when NumPy is available.
+    """
+    if engine is None:
+        engine = "array" if np is not None else "counter"
+    if engine == "external":
+        distance, similarity_score = external_scores(filename, run_size)
+    elif engine == "array":
+        left, right = load_columns(filename)
+        if part == 1:
+            distance = total_distance_array(left, right)
+        else:
+            similarity_score = similarity_array(left, right)
+    else:
+        left_list, right_list = read_lists(filename)
+        if part == 1:
+            distance = total_distance_lists(left_list, right_list)
+        else:
+            similarity_score = similarity_counter(left_list, right_list)
+
+    # Print the result
+    if part == 1:
+        print(f"Total distance: {distance}")
+    else:
+        print(f"Similarity score: {similarity_score}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--engine", choices=("array", "counter", "external"))
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE,
+                        help="numbers per sorted run in external mode")
+    args = parser.parse_args()
+    solve(part=args.part, engine=args.engine, run_size=args.run_size)
@@ -1,5 +1,15 @@
+import argparse
 from collections import Counter
 
+try:
+    import numpy as np
+except ImportError:  # the per-report checker below works without it
+    np = None
+
+# Allowed differences between adjacent levels, per direction
+INCREASING = (1, 3)
+DECREASING = (-3, -1)
+
 def is_safe(report):
     # Calculate differences between adjacent levels
     differences = [report[i + 1] - report[i] for i in range(len(report) - 1)]
@@ -27,17 +37,124 @@ def can_be_safe_with_removal(report):
     # If no single removal makes it safe, return False
     return False
 
-def solve():
-    # Read input from file
-    with open("input.txt") as file:
-        reports = [list(map(int, line.split())) for line in file.readlines()]
-    
-    # Count the number of safe reports (with or without the Problem Dampener)
-    safe_count = sum(1 for report in reports if can_be_safe_with_removal(report))
-    
+def _first_violation(report, lo, hi):
+    # Index i of the first adjacent pair (i, i + 1) outside [lo, hi], or -1
+    for i in range(len(report) - 1):
+        if not lo <= report[i + 1] - report[i] <= hi:
+            return i
+    return -1
+
+def _valid_without(report, lo, hi, skip):
+    # Whether the report minus the level at index skip steps within [lo, hi]
+    previous = None
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if previous is not None and not lo <= level - previous <= hi:
+            return False
+        previous = level
+    return True
+
+def is_safe_with_dampener(report):
+    """
+    O(n) version of can_be_safe_with_removal.
+    For each direction the differences are scanned once for the first bad
+    pair (i, i + 1). Any removal that fixes the report must take out one of
+    those two levels, so only they are tried, each with one more scan and
+    no list copies.
+    """
+    for lo, hi in (INCREASING, DECREASING):
+        i = _first_violation(report, lo, hi)
+        if i == -1:
+            return True
+        if _valid_without(report, lo, hi, i) or _valid_without(report, lo, hi, i + 1):
+            return True
+    return False
+
+def load_reports_by_length(filename):
+    """
+    Reads all reports into NumPy arrays grouped by length.
+    Returns a dict mapping length to an int64 array with one report per row.
+
+    All numbers are parsed in one np.fromstring call; the number of levels
+    on each line is found by counting token starts per line on the raw
+    bytes, so no line is split in Python.
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+    values = np.fromstring(data.decode(), dtype=np.int64, sep=' ')
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    space = (raw == ord(' ')) | (raw == ord('\t')) | (raw == ord('\r')) | (raw == ord('\n'))
+    token_starts = ~space
+    token_starts[1:] &= space[:-1]
+    line_of_token = np.searchsorted(np.flatnonzero(raw == ord('\n')), np.flatnonzero(token_starts))
+    lengths = np.bincount(line_of_token)
+    lengths = lengths[lengths > 0]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    groups = {}
+    for length in np.unique(lengths):
+        starts = offsets[lengths == length]
+        groups[int(length)] = values[starts[:, None] + np.arange(length)]
+    return groups
+
+def _safe_mask(reports, lo, hi, dampener):
+    # Per-row safety of equal-length reports for one direction
+    count, length = reports.shape
+    if length <= (2 if dampener else 1):
+        return np.ones(count, dtype=bool)
+    diffs = np.diff(reports, axis=1)
+    ok = (diffs >= lo) & (diffs <= hi)
+    # prefix[:, j]: pairs 0..j-1 are fine; suffix[:, j]: pairs j.. are fine
+    prefix = np.ones((count, length), dtype=bool)
+    prefix[:, 1:] = np.logical_and.accumulate(ok, axis=1)
+    if not dampener:
+        return prefix[:, -1]
+    suffix = np.ones((count, length), dtype=bool)
+    suffix[:, :-1] = np.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1]
+
+    # Removing level k keeps pairs before k - 1 and from k + 1 on, and joins
+    # levels k - 1 and k + 1 when both exist
+    bridge = reports[:, 2:] - reports[:, :-2]
+    inner = prefix[:, :-2] & suffix[:, 2:] & (bridge >= lo) & (bridge <= hi)
+    return suffix[:, 1] | prefix[:, -2] | inner.any(axis=1)
+
+def count_safe_batch(groups, dampener=True):
+    """
+    Counts the safe reports in the arrays from load_reports_by_length.
+    Each length group is classified at once using prefix/suffix validity of
+    the differences, so every possible single removal is checked in O(n)
+    array work per report.
+    """
+    total = 0
+    for reports in groups.values():
+        safe = _safe_mask(reports, *INCREASING, dampener) | _safe_mask(reports, *DECREASING, dampener)
+        total += int(np.count_nonzero(safe))
+    return total
+
+def solve(filename="input.txt", engine=None):
+    """
+    engine is "batch" (NumPy, grouped by length) or "report" (one report at
+    a time); by default the batch engine is used when NumPy is available.
+    """
+    if engine is None:
+        engine = "batch" if np is not None else "report"
+    if engine == "batch":
+        safe_count = count_safe_batch(load_reports_by_length(filename))
+    else:
+        # Read input from file
+        with open(filename) as file:
+            reports = [list(map(int, line.split())) for line in file if line.strip()]
+
+        # Count the number of safe reports (with or without the Problem Dampener)
+        safe_count = sum(1 for report in reports if is_safe_with_dampener(report))
+
     # Print the result
     print(f"Number of safe reports with Problem Dampener: {safe_count}")
 
 if __name__ == "__main__":
-    solve()
-
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engine", choices=("batch", "report"))
+    args = parser.parse_args()
+    solve(engine=args.engine)
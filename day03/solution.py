@@ -1,38 +1,146 @@
+import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
-def solve():
-    # Read input from file
-    with open("input.txt") as file:
-        memory = file.read().strip()
-    
-    # Define regex patterns
-    mul_pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    do_pattern = r"do\(\)"
-    dont_pattern = r"don't\(\)"
-    
-    # Combine patterns to extract all instructions in order
-    combined_pattern = f"{mul_pattern}|{do_pattern}|{dont_pattern}"
-    
-    # Find all matches
-    matches = re.finditer(combined_pattern, memory)
-    
-    # Track whether mul instructions are enabled
-    enabled = True
-    total = 0
-    
-    # Process each match
-    for match in matches:
-        if match.group(1) and match.group(2):  # This is a mul(X,Y) instruction
-            x, y = int(match.group(1)), int(match.group(2))
+# mul(X,Y) with 1-3 digit operands, do() and don't(), in input order
+INSTRUCTION_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+
+# The longest instruction, mul(999,999); a chunk's last bytes shorter than
+# this may hold the start of an instruction that finishes in the next chunk
+MAX_INSTRUCTION_LENGTH = len(b"mul(999,999)")
+
+CHUNK_SIZE = 1 << 20
+
+def scan_buffer(buffer, enabled, stop):
+    """
+    Applies the instructions in buffer that start before offset stop.
+    enabled may be None for "not known yet"; products seen before the
+    first do()/don't() then go to a separate sum.
+    Returns (sum of enabled products, sum of products while the state was
+    unknown, state afterwards, offset where the next scan should resume).
+    """
+    total = unknown = 0
+    resume = stop
+    for match in INSTRUCTION_PATTERN.finditer(buffer):
+        if match.start() >= stop:
+            break
+        x = match.group(1)
+        if x is not None:
             if enabled:
-                total += x * y
-        elif match.group(0) == "do()":  # This is a do() instruction
-            enabled = True
-        elif match.group(0) == "don't()":  # This is a don't() instruction
-            enabled = False
-    
+                total += int(x) * int(match.group(2))
+            elif enabled is None:
+                unknown += int(x) * int(match.group(2))
+        else:
+            enabled = match.group(0) == b"do()"
+        resume = max(stop, match.end())
+    return total, unknown, enabled, resume
+
+def iter_chunks(filename, chunk_size=CHUNK_SIZE):
+    with open(filename, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def scan_chunks(chunks, enabled=True, tail=b""):
+    """
+    Streams the memory dump chunk by chunk in constant memory.
+    Returns (sum of enabled products, sum of products seen before the first
+    do()/don't() when enabled is None, final state).
+
+    Each chunk is scanned together with the unscanned tail of the previous
+    one. Instructions starting in the last MAX_INSTRUCTION_LENGTH - 1 bytes
+    may be cut off, so those bytes are carried over and scanned with the
+    next chunk; the enabled state carries over the same way. tail holds the
+    bytes that follow the chunks, if any: instructions may finish in it but
+    not start in it.
+    """
+    total = unknown = 0
+    carry = b""
+    for chunk in chunks:
+        buffer = carry + chunk
+        stop = len(buffer) - (MAX_INSTRUCTION_LENGTH - 1)
+        if stop <= 0:
+            carry = buffer
+            continue
+        partial, partial_unknown, enabled, resume = scan_buffer(buffer, enabled, stop)
+        total += partial
+        unknown += partial_unknown
+        carry = buffer[resume:]
+    partial, partial_unknown, enabled, _ = scan_buffer(carry + tail, enabled, len(carry))
+    return total + partial, unknown + partial_unknown, enabled
+
+def iter_range(file, start, end, chunk_size=CHUNK_SIZE):
+    file.seek(start)
+    while start < end:
+        chunk = file.read(min(chunk_size, end - start))
+        if not chunk:
+            return
+        start += len(chunk)
+        yield chunk
+
+def scan_segment(filename, start, end, chunk_size=CHUNK_SIZE):
+    """
+    Scans the instructions starting in bytes [start, end) of the file
+    without knowing the state at start. Returns (sum if enabled at start,
+    sum if disabled at start, state at end or None if the segment holds no
+    do()/don't()).
+    """
+    with open(filename, "rb") as file:
+        file.seek(end)
+        tail = file.read(MAX_INSTRUCTION_LENGTH - 1)
+        total, unknown, state = scan_chunks(iter_range(file, start, end, chunk_size), None, tail)
+    return total + unknown, total, state
+
+def stitch_segments(results, enabled=True):
+    """
+    Combines per-segment results, in file order, into the serial total:
+    the state entering each segment picks which of its two sums applies.
+    """
+    total = 0
+    for if_enabled, if_disabled, state in results:
+        total += if_enabled if enabled else if_disabled
+        if state is not None:
+            enabled = state
+    return total
+
+def scan_parallel(filename, workers, chunk_size=CHUNK_SIZE):
+    """
+    Splits the file into segments and scans them in a process pool. The
+    state at any offset depends only on the last do()/don't() before it, so
+    each segment is scanned for both starting states and the results are
+    stitched together in order, giving exactly the serial total.
+    """
+    size = os.path.getsize(filename)
+    # A few segments per worker evens out the load
+    step = max(MAX_INSTRUCTION_LENGTH, -(-size // (workers * 4)))
+    bounds = [(start, min(start + step, size)) for start in range(0, size, step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(scan_segment, [filename] * len(bounds),
+                           [start for start, _ in bounds], [end for _, end in bounds],
+                           [chunk_size] * len(bounds))
+        return stitch_segments(results)
+
+def solve(filename="input.txt", chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Prints the sum of the enabled multiplications. With workers > 1 the file
+    is scanned in segments over a process pool; workers=0 uses every core.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        total = scan_parallel(filename, workers, chunk_size)
+    else:
+        total, _, _ = scan_chunks(iter_chunks(filename, chunk_size))
+
     # Print the result
     print(f"Total sum of enabled multiplications: {total}")
 
 if __name__ == "__main__":
-    solve()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes read at a time")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (1 = serial, 0 = all cores)")
+    args = parser.parse_args()
+    solve(chunk_size=args.chunk_size, workers=args.workers)
@@ -1,36 +1,221 @@
-# Read the grid from 'input.txt'
-with open('input.txt', 'r') as file:
-    grid_str = [line.strip() for line in file if line.strip()]
-
-# Convert the grid into a 2D list
-grid = [list(row) for row in grid_str]
-n = len(grid)
-m = len(grid[0]) if n > 0 else 0
-
-# Initialize the count of X-MAS patterns
-count = 0
-
-# Define the valid patterns for diagonals
-valid_patterns = [('M', 'A', 'S'), ('S', 'A', 'M')]
-
-# Iterate over the grid, excluding the borders to prevent index errors
-for i in range(1, n - 1):
-    for j in range(1, m - 1):
-        # Check if the center is 'A'
-        if grid[i][j] == 'A':
-            # Check Diagonal 1 (top-left to bottom-right)
-            diag1 = (grid[i - 1][j - 1], grid[i][j], grid[i + 1][j + 1])
-            diag1_rev = diag1[::-1]
-            diag1_ok = diag1 in valid_patterns or diag1_rev in valid_patterns
-
-            # Check Diagonal 2 (top-right to bottom-left)
-            diag2 = (grid[i - 1][j + 1], grid[i][j], grid[i + 1][j - 1])
-            diag2_rev = diag2[::-1]
-            diag2_ok = diag2 in valid_patterns or diag2_rev in valid_patterns
-
-            # If both diagonals are valid, increment the count
-            if diag1_ok and diag2_ok:
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python matcher below works without it
+    np = None
+
+# The eight straight-line directions as (row step, column step)
+DIRECTIONS = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+# The X-MAS cross; '.' cells can hold anything
+X_MAS_MASK = ("M.S",
+              ".A.",
+              "M.S")
+
+# A pattern is a tuple of (row offset, column offset, byte) cells relative to
+# an anchor; it matches wherever every cell holds its byte.
+
+def word_patterns(word, directions=DIRECTIONS):
+    """
+    Returns one pattern per direction for a straight word.
+    """
+    word = word.encode() if isinstance(word, str) else word
+    return [tuple((k * dr, k * dc, byte) for k, byte in enumerate(word))
+            for dr, dc in directions]
+
+def mask_pattern(mask, wildcard="."):
+    """
+    Returns the pattern of a mask given as rows of equal length, skipping
+    wildcard cells.
+    """
+    return tuple((r, c, ord(ch)) for r, row in enumerate(mask)
+                 for c, ch in enumerate(row) if ch != wildcard)
+
+def rotations(mask):
+    """
+    Returns the distinct quarter-turn rotations of a mask.
+    """
+    found = []
+    for _ in range(4):
+        if mask not in found:
+            found.append(mask)
+        mask = tuple("".join(row) for row in zip(*mask[::-1]))
+    return found
+
+def mask_patterns(mask, wildcard="."):
+    return [mask_pattern(rotated, wildcard) for rotated in rotations(tuple(mask))]
+
+XMAS_PATTERNS = word_patterns("XMAS")
+X_MAS_PATTERNS = mask_patterns(X_MAS_MASK)
+
+def load_grid(filename):
+    """
+    Reads the letter grid into a (rows, cols) uint8 NumPy array, straight
+    from the file bytes.
+    """
+    raw = np.fromfile(filename, dtype=np.uint8)
+    end = len(raw)
+    while end and raw[end - 1] in b"\r\n ":
+        end -= 1
+    raw = raw[:end]
+    newlines = np.flatnonzero(raw == ord("\n"))
+    cols = int(newlines[0]) if len(newlines) else len(raw)
+    stride = cols + 1
+    ending = b"\n"
+    if cols and raw[cols - 1] == ord("\r"):
+        cols -= 1
+        ending = b"\r\n"
+    # Every row but the last ends in a line ending; the strip above took the
+    # last row's, so put the same one back
+    raw = np.append(raw, np.frombuffer(ending, dtype=np.uint8))
+    if len(raw) % stride:
+        raise ValueError("All rows of the grid must have the same width")
+    return raw.reshape(-1, stride)[:, :cols]
+
+def count_pattern(grid, pattern, planes=None, anchor_rows=None):
+    """
+    Counts the anchors where pattern matches in a 2D uint8 array.
+
+    Each pattern cell selects the shifted window of the grid it covers for
+    every possible anchor; ANDing the windows' equality masks leaves True
+    exactly at the matches. planes can map bytes to precomputed grid == byte
+    masks so they are shared between patterns. With anchor_rows, only
+    matches whose top row is among the first anchor_rows rows are counted.
+    """
+    rows, cols = grid.shape
+    min_r = min(r for r, _, _ in pattern)
+    max_r = max(r for r, _, _ in pattern)
+    min_c = min(c for _, c, _ in pattern)
+    max_c = max(c for _, c, _ in pattern)
+    # Anchors (a, b) with every cell (a + r, b + c) inside the grid
+    top, bottom = -min_r, rows - max_r
+    left, right = -min_c, cols - max_c
+    if anchor_rows is not None:
+        bottom = min(bottom, anchor_rows - min_r)
+    if top >= bottom or left >= right:
+        return 0
+
+    matches = None
+    for r, c, byte in pattern:
+        plane = planes[byte] if planes is not None else grid == byte
+        window = plane[top + r:bottom + r, left + c:right + c]
+        if matches is None:
+            matches = window.copy()
+        else:
+            matches &= window
+    return int(np.count_nonzero(matches))
+
+def count_patterns(grid, patterns, anchor_rows=None):
+    """
+    Returns the total number of matches of all patterns in the grid.
+    """
+    needed = {byte for pattern in patterns for _, _, byte in pattern}
+    planes = {byte: grid == byte for byte in needed}
+    return sum(count_pattern(grid, pattern, planes, anchor_rows) for pattern in patterns)
+
+def pattern_height(pattern):
+    return max(r for r, _, _ in pattern) - min(r for r, _, _ in pattern) + 1
+
+# Worker-process state, set up once per worker by _attach_grid
+_shared = {}
+
+def _attach_grid(name, shape, patterns):
+    shm = shared_memory.SharedMemory(name=name)
+    _shared['shm'] = shm
+    _shared['grid'] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    _shared['patterns'] = patterns
+
+def _count_band(band):
+    start, stop, overlap = band
+    grid = _shared['grid'][start:stop + overlap]
+    return count_patterns(grid, _shared['patterns'], anchor_rows=stop - start)
+
+def row_bands(rows, band_rows, overlap):
+    """
+    Splits the anchor rows into (start, stop, overlap) bands. A band reads
+    overlap extra rows past stop so patterns starting near its end can
+    finish, but only counts matches starting in [start, stop), so matches
+    across a seam are counted exactly once.
+    """
+    return [(start, min(start + band_rows, rows), overlap)
+            for start in range(0, rows, band_rows)]
+
+def count_patterns_parallel(grid, patterns, workers, band_rows=None):
+    """
+    Counts the matches of all patterns with the rows split into bands over a
+    process pool. The grid is copied once into shared memory that workers
+    map read-only; only the band bounds are sent per task.
+    """
+    rows = len(grid)
+    if rows == 0:
+        return 0
+    overlap = max(pattern_height(pattern) for pattern in patterns) - 1
+    if band_rows is None:
+        # A few bands per worker evens out the load
+        band_rows = max(overlap + 1, -(-rows // (workers * 4)))
+    shm = shared_memory.SharedMemory(create=True, size=max(grid.nbytes, 1))
+    try:
+        shared = np.ndarray(grid.shape, dtype=np.uint8, buffer=shm.buf)
+        shared[:] = grid
+        del shared
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_grid,
+                                 initargs=(shm.name, grid.shape, patterns)) as pool:
+            return sum(pool.map(_count_band, row_bands(rows, band_rows, overlap)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+def count_pattern_loop(lines, pattern):
+    """
+    Pure-Python reference for count_pattern over a list of row strings.
+    """
+    rows = len(lines)
+    cols = len(lines[0]) if rows else 0
+    cells = [(r, c, chr(byte)) for r, c, byte in pattern]
+    count = 0
+    for a in range(rows):
+        for b in range(cols):
+            for r, c, ch in cells:
+                i, j = a + r, b + c
+                if not (0 <= i < rows and 0 <= j < cols) or lines[i][j] != ch:
+                    break
+            else:
                 count += 1
+    return count
+
+def read_lines(filename):
+    with open(filename, 'r') as file:
+        return [line.strip() for line in file if line.strip()]
+
+def count_in_file(filename, patterns, workers=1):
+    workers = workers or os.cpu_count() or 1
+    if np is not None:
+        grid = load_grid(filename)
+        if workers > 1:
+            return count_patterns_parallel(grid, patterns, workers)
+        return count_patterns(grid, patterns)
+    lines = read_lines(filename)
+    return sum(count_pattern_loop(lines, pattern) for pattern in patterns)
+
+def main(filename='input.txt', part=2, workers=1):
+    """
+    Prints the number of XMAS words (part 1) or X-MAS crosses (part 2).
+    With workers > 1 the grid is scanned in row bands over a process pool;
+    workers=0 uses every core.
+    """
+    if part == 1:
+        print("Number of XMAS occurrences:", count_in_file(filename, XMAS_PATTERNS, workers))
+    else:
+        print("Number of X-MAS patterns:", count_in_file(filename, X_MAS_PATTERNS, workers))
 
-# Output the result
-print("Number of X-MAS patterns:", count)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (1 = serial, 0 = all cores)")
+    args = parser.parse_args()
+    main(part=args.part, workers=args.workers)
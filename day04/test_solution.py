@@ -0,0 +1,22 @@
+import pytest
+
+from day04.solution import X_MAS_PATTERNS, XMAS_PATTERNS, count_in_file
+
+EXAMPLE = ["MMMSXXMASM",
+           "MSAMXMSMSA",
+           "AMXSXMAAMM",
+           "MSAMASMSMX",
+           "XMASAMXAMM",
+           "XXAMMXXAMA",
+           "SMSMSASXSS",
+           "SAXAMASAAA",
+           "MAMMMXMMMM",
+           "MXMXAXMASX"]
+
+
+@pytest.mark.parametrize("ending", ["\n", "\r\n"])
+@pytest.mark.parametrize("patterns, expected", [(XMAS_PATTERNS, 18), (X_MAS_PATTERNS, 9)])
+def test_example_with_either_line_ending(tmp_path, ending, patterns, expected):
+    path = tmp_path / "input.txt"
+    path.write_bytes(ending.join(EXAMPLE + [""]).encode())
+    assert count_in_file(str(path), patterns) == expected
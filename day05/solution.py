@@ -1,7 +1,10 @@
+import heapq
+from collections import OrderedDict, defaultdict
+
+_NO_PAGES = frozenset()
+
 # Function for topological sort with preference
 def topological_sort_with_preference(nodes, edges, preference_order):
-    from collections import defaultdict
-
     # Build adjacency list and in-degree dictionary
     adj = defaultdict(list)
     in_degree = {node: 0 for node in nodes}
@@ -13,109 +16,254 @@ def topological_sort_with_preference(nodes, edges, preference_order):
     # Map node to its position in the original order
     preference = {node: idx for idx, node in enumerate(preference_order)}
 
-    # Nodes with zero in-degree, sorted by preference
-    zero_in_degree = [node for node in nodes if in_degree[node] == 0]
-    zero_in_degree.sort(key=lambda x: preference.get(x, float('inf')))
+    # Nodes with zero in-degree, keyed by preference; the counter breaks ties
+    # between nodes that have no preference without comparing the nodes
+    zero_in_degree = [(preference.get(node, float('inf')), i, node)
+                      for i, node in enumerate(nodes) if in_degree[node] == 0]
+    heapq.heapify(zero_in_degree)
+    counter = len(zero_in_degree)
 
     sorted_list = []
     while zero_in_degree:
-        node = zero_in_degree.pop(0)
+        _, _, node = heapq.heappop(zero_in_degree)
         sorted_list.append(node)
         for neighbor in adj[node]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
-                zero_in_degree.append(neighbor)
-                zero_in_degree.sort(key=lambda x: preference.get(x, float('inf')))
+                heapq.heappush(zero_in_degree, (preference.get(neighbor, float('inf')), counter, neighbor))
+                counter += 1
     if len(sorted_list) != len(nodes):
         # Cycle detected
         raise ValueError("Cycle detected in the graph")
     return sorted_list
 
-# Main code
-# Read the input from 'input.txt'
-with open('input.txt', 'r') as f:
-    lines = [line.strip() for line in f]
-
-# Split the input into rules and updates
-rules = []
-updates = []
-i = 0
-
-# Read rules until an empty line is found
-while i < len(lines) and lines[i]:
-    rules.append(lines[i])
-    i += 1
-
-# Skip empty lines
-while i < len(lines) and not lines[i]:
-    i += 1
-
-# Read updates
-while i < len(lines):
-    if lines[i]:
-        updates.append(lines[i])
-    i += 1
-
-# Parse the rules into a list of tuples
-ordering_rules = []
-for rule in rules:
-    x_str, y_str = rule.strip().split('|')
-    x = int(x_str)
-    y = int(y_str)
-    ordering_rules.append((x, y))
-
-# Parse the updates into lists of integers
-update_sequences = []
-for update in updates:
-    pages = [int(page) for page in update.strip().split(',')]
-    update_sequences.append(pages)
-
-valid_updates = []
-invalid_updates = []
-
-# Identify valid and invalid updates
-for pages in update_sequences:
-    pages_in_update = set(pages)
-    # Extract relevant ordering rules
-    relevant_rules = [(x, y) for (x, y) in ordering_rules if x in pages_in_update and y in pages_in_update]
-    # Create a mapping from page to its index in the sequence
-    page_to_index = {page: idx for idx, page in enumerate(pages)}
-    # Check if all relevant ordering rules are satisfied
-    valid = True
-    for (x, y) in relevant_rules:
-        if page_to_index[x] >= page_to_index[y]:
-            valid = False
-            break
-    if valid:
-        # Update is correctly ordered
-        valid_updates.append(pages)
-    else:
-        # Update is incorrectly ordered
-        invalid_updates.append(pages)
-
-# Process invalid updates
-total = 0  # Sum of middle page numbers after reordering invalid updates
-
-for pages in invalid_updates:
-    pages_in_update = set(pages)
-    # Extract relevant ordering rules
-    relevant_rules = [(x, y) for (x, y) in ordering_rules if x in pages_in_update and y in pages_in_update]
-    # Build the dependency graph
-    nodes = pages_in_update
-    edges = relevant_rules
-
-    # Perform topological sort with preference
-    try:
-        sorted_pages = topological_sort_with_preference(nodes, edges, pages)
-    except ValueError as e:
-        print(f"Cycle detected in update with pages: {pages}")
-        continue  # Skip this update if there's a cycle
-
-    # Find the middle page
-    mid_index = len(sorted_pages) // 2  # Integer division
-    middle_page = sorted_pages[mid_index]
-    total += middle_page
-
-# Output the result
-print(total)
+def parse_input(filename):
+    """
+    Reads the page ordering rules and the updates.
+    Returns (ordering_rules, update_sequences): a list of (x, y) tuples meaning
+    x must come before y, and a list of page lists.
+    """
+    with open(filename, 'r') as f:
+        lines = [line.strip() for line in f]
+
+    # Split the input into rules and updates
+    rules = []
+    updates = []
+    i = 0
+
+    # Read rules until an empty line is found
+    while i < len(lines) and lines[i]:
+        rules.append(lines[i])
+        i += 1
+
+    # Skip empty lines
+    while i < len(lines) and not lines[i]:
+        i += 1
+
+    # Read updates
+    while i < len(lines):
+        if lines[i]:
+            updates.append(lines[i])
+        i += 1
+
+    # Parse the rules into a list of tuples
+    ordering_rules = []
+    for rule in rules:
+        x_str, y_str = rule.strip().split('|')
+        ordering_rules.append((int(x_str), int(y_str)))
+
+    # Parse the updates into lists of integers
+    update_sequences = [[int(page) for page in update.strip().split(',')] for update in updates]
+    return ordering_rules, update_sequences
+
+def build_rule_index(ordering_rules):
+    """
+    Builds the rule index once: maps each page to the set of pages that must
+    come after it.
+    """
+    successors = defaultdict(set)
+    for x, y in ordering_rules:
+        successors[x].add(y)
+    return successors
+
+def is_correctly_ordered(pages, successors):
+    """
+    Checks an update against the rule index, looking only at pairs of pages
+    inside the update: a page is out of order if it must precede a page
+    that already appeared.
+    """
+    seen = set()
+    for page in pages:
+        if not successors.get(page, _NO_PAGES).isdisjoint(seen):
+            return False
+        seen.add(page)
+    return True
+
+def _order_by_rule_counts(pages, successors):
+    """
+    If the rules are total on the update, every page's position is fixed by
+    how many of the other pages must follow it, so the order can be placed
+    directly without sorting. Returns that order, or None if the rules are
+    not a consistent total order on these pages.
+    """
+    update = set(pages)
+    n = len(pages)
+    order = [None] * n
+    for page in pages:
+        position = n - 1 - len(successors.get(page, _NO_PAGES) & update)
+        if position < 0 or order[position] is not None:
+            return None
+        order[position] = page
+    return order if is_correctly_ordered(order, successors) else None
+
+def repair_order(pages, successors):
+    """
+    Returns the pages reordered to satisfy every relevant rule.
+    Uses direct placement when the rules are total on the update, otherwise
+    a heap-based Kahn sort that keeps the original order where rules allow.
+    Raises ValueError if the relevant rules contain a cycle.
+    """
+    order = _order_by_rule_counts(pages, successors)
+    if order is not None:
+        return order
+    update = set(pages)
+    edges = [(x, y) for x in update for y in successors.get(x, _NO_PAGES) & update]
+    return topological_sort_with_preference(update, edges, pages)
+
+def repaired_middle_page(pages, successors):
+    """
+    Returns the middle page (index len(pages) // 2) of the repaired update.
+    When the rules are a consistent total order on the update, a page's
+    position is fixed by how many of the other pages must follow it, so the
+    middle page is the one with n - 1 - n // 2 successors and no order is
+    built. Otherwise falls back to repair_order, which raises ValueError if
+    the relevant rules contain a cycle.
+    """
+    update = set(pages)
+    n = len(pages)
+    target = n - 1 - n // 2
+    counts = set()
+    middle = None
+    for page in pages:
+        after = successors.get(page, _NO_PAGES) & update
+        count = len(after)
+        # Distinct counts with no pair of pages ruled both ways mean every
+        # pair is ruled exactly once and the rules are transitive on it
+        if count in counts or count >= n or any(
+                page in successors.get(other, _NO_PAGES) for other in after):
+            return repair_order(pages, successors)[n // 2]
+        counts.add(count)
+        if count == target:
+            middle = page
+    return middle
+
+class OrderingIndex:
+    """
+    In-process rule index for checking and repairing updates as rules and
+    updates keep arriving.
+
+    Rules are kept in the same successor-set index used above and changed in
+    place. Verdicts and repaired orders are cached per update (least recently
+    used entries are evicted beyond max_cached), and a rule change only drops
+    the cached updates that contain both of the rule's pages, since no other
+    update can be affected by it.
+    """
+
+    def __init__(self, ordering_rules=(), max_cached=100_000):
+        self.successors = build_rule_index(ordering_rules)
+        self.max_cached = max_cached
+        self._cache = OrderedDict()           # update tuple -> {'valid': ..., 'repaired': ...}
+        self._cached_by_page = defaultdict(set)  # page -> update tuples in the cache
+
+    def add_rule(self, before, after):
+        """
+        Adds the rule before|after.
+        """
+        pages = self.successors[before]
+        if after not in pages:
+            pages.add(after)
+            self._invalidate(before, after)
+
+    def remove_rule(self, before, after):
+        """
+        Removes the rule before|after if present.
+        """
+        pages = self.successors.get(before)
+        if pages and after in pages:
+            pages.discard(after)
+            if not pages:
+                del self.successors[before]
+            self._invalidate(before, after)
+
+    def check(self, update):
+        """
+        Returns True if the update satisfies every relevant rule.
+        """
+        entry = self._entry(update)
+        if 'valid' not in entry:
+            entry['valid'] = is_correctly_ordered(update, self.successors)
+        return entry['valid']
+
+    def repair(self, update):
+        """
+        Returns the update reordered to satisfy every relevant rule (a copy
+        of it when it already does). Raises ValueError on a rule cycle.
+        """
+        entry = self._entry(update)
+        if 'repaired' not in entry:
+            if self.check(update):
+                entry['repaired'] = tuple(update)
+            else:
+                entry['repaired'] = tuple(repair_order(list(update), self.successors))
+        return list(entry['repaired'])
+
+    def _entry(self, update):
+        key = tuple(update)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+        entry = self._cache[key] = {}
+        for page in key:
+            self._cached_by_page[page].add(key)
+        if len(self._cache) > self.max_cached:
+            self._forget(next(iter(self._cache)))
+        return entry
+
+    def _forget(self, key):
+        del self._cache[key]
+        for page in key:
+            keys = self._cached_by_page[page]
+            keys.discard(key)
+            if not keys:
+                del self._cached_by_page[page]
+
+    def _invalidate(self, before, after):
+        first = self._cached_by_page.get(before)
+        second = self._cached_by_page.get(after)
+        if first and second:
+            for key in first & second:
+                self._forget(key)
+
+def main(filename='input.txt'):
+    ordering_rules, update_sequences = parse_input(filename)
+    successors = build_rule_index(ordering_rules)
+
+    # Process invalid updates
+    total = 0  # Sum of middle page numbers after reordering invalid updates
+
+    for pages in update_sequences:
+        if is_correctly_ordered(pages, successors):
+            continue
+        try:
+            middle_page = repaired_middle_page(pages, successors)
+        except ValueError:
+            print(f"Cycle detected in update with pages: {pages}")
+            continue  # Skip this update if there's a cycle
+        total += middle_page
+
+    # Output the result
+    print(total)
 
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
+import argparse
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
 def turn_right(direction):
     # directions are (dr, dc)
     directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
@@ -66,13 +72,201 @@ def simulate(grid, extra_obstacle=None):
             return 'loop'
         visited_states.add(state)
 
-def main():
-    grid = read_map("input.txt")
+# Headings in turning order: up, right, down, left
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+HEADINGS = {'^': 0, '>': 1, 'v': 2, '<': 3}
 
-    start_r, start_c, start_dir = find_guard(grid)
+def build_jump_table(grid):
+    """
+    Precomputes, for every cell and heading, where the guard stops: the last
+    free cell before the next obstacle, or -1 if it walks off the map.
+    Cells are flat indices r * cols + c and jumps[heading] is an array over them.
+    Returns (jumps, blocked) where blocked is a bytearray of obstacle cells.
+    """
+    rows, cols = len(grid), len(grid[0])
+    blocked = bytearray(rows * cols)
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r][c] == '#':
+                blocked[r * cols + c] = 1
 
-    # For part two:
-    # We want to know how many positions (currently '.') can become an obstruction to cause a loop.
+    jumps = [array('i', [-1]) * (rows * cols) for _ in range(4)]
+    up, right, down, left = jumps
+    for c in range(cols):
+        # Scan down the column for "up" stops, then back up for "down" stops
+        stop = -1
+        for r in range(rows):
+            i = r * cols + c
+            if blocked[i]:
+                stop = i + cols if r + 1 < rows else -1
+            else:
+                up[i] = stop
+        stop = -1
+        for r in range(rows - 1, -1, -1):
+            i = r * cols + c
+            if blocked[i]:
+                stop = i - cols if r > 0 else -1
+            else:
+                down[i] = stop
+    for r in range(rows):
+        base = r * cols
+        stop = -1
+        for c in range(cols):
+            i = base + c
+            if blocked[i]:
+                stop = i + 1 if c + 1 < cols else -1
+            else:
+                left[i] = stop
+        stop = -1
+        for c in range(cols - 1, -1, -1):
+            i = base + c
+            if blocked[i]:
+                stop = i - 1 if c > 0 else -1
+            else:
+                right[i] = stop
+    return jumps, blocked
+
+def guard_path(blocked, rows, cols, start, heading):
+    """
+    Walks the guard cell by cell on the unmodified map.
+    Returns (path, loops): path lists (cell, previous cell, heading) for every
+    cell the guard enters for the first time, i.e. the state just before
+    stepping onto it, excluding the start cell; loops is True if the guard
+    never leaves the map.
+    """
+    visited = bytearray(rows * cols)
+    visited[start] = 1
+    seen_states = bytearray(rows * cols * 4)
+    path = []
+    pos, d = start, heading
+    r, c = divmod(start, cols)
+    while True:
+        if seen_states[pos * 4 + d]:
+            return path, True
+        seen_states[pos * 4 + d] = 1
+        dr, dc = DIRECTIONS[d]
+        fr, fc = r + dr, c + dc
+        if not (0 <= fr < rows and 0 <= fc < cols):
+            return path, False
+        front = fr * cols + fc
+        if blocked[front]:
+            d = (d + 1) & 3
+            continue
+        if not visited[front]:
+            visited[front] = 1
+            path.append((front, pos, d))
+        pos, r, c = front, fr, fc
+
+def walks_into_loop(jumps, cols, start, heading, obstacle, seen, stamp):
+    """
+    Follows the jump table from (start, heading) with one extra obstacle.
+    The obstacle is overlaid on each jump rather than written into the table:
+    a jump is cut short only if the obstacle lies on it.
+    seen holds the stamp of the last trial that recorded each (stop, heading)
+    state, so it never needs clearing between trials.
+    """
+    orow, ocol = divmod(obstacle, cols)
+    pos, d = start, heading
+    while True:
+        stop = jumps[d][pos]
+        r, c = divmod(pos, cols)
+        if d == 0:
+            if c == ocol and orow < r and (stop < 0 or orow >= stop // cols):
+                stop = obstacle + cols
+        elif d == 1:
+            if r == orow and ocol > c and (stop < 0 or ocol <= stop % cols):
+                stop = obstacle - 1
+        elif d == 2:
+            if c == ocol and orow > r and (stop < 0 or orow <= stop // cols):
+                stop = obstacle - cols
+        else:
+            if r == orow and ocol < c and (stop < 0 or ocol >= stop % cols):
+                stop = obstacle + 1
+        if stop < 0:
+            return False
+        key = stop * 4 + d
+        if seen[key] == stamp:
+            return True
+        seen[key] = stamp
+        pos, d = stop, (d + 1) & 3
+
+def count_loop_obstacles(grid, workers=1):
+    """
+    Counts the positions where a single new obstruction traps the guard in a loop.
+    Only cells on the guard's original path can matter, and each trial starts
+    from the state just before the guard first enters the candidate cell.
+    With workers > 1 the trials are sharded across a process pool; workers=0
+    uses every core.
+    """
+    workers = workers or os.cpu_count() or 1
+    rows, cols = len(grid), len(grid[0])
+    sr, sc, _ = find_guard(grid)
+    start, heading = sr * cols + sc, HEADINGS[grid[sr][sc]]
+    jumps, blocked = build_jump_table(grid)
+
+    path, loops = guard_path(blocked, rows, cols, start, heading)
+    loop_count = 0
+    if loops:
+        # Already trapped: an obstruction off the path changes nothing
+        loop_count = rows * cols - sum(blocked) - len(path) - 1
+
+    if workers > 1 and len(path) > 1:
+        return loop_count + count_loops_parallel(jumps, cols, path, workers)
+
+    seen = array('i', [0]) * (rows * cols * 4)
+    for stamp, (cell, before, d) in enumerate(path, 1):
+        if walks_into_loop(jumps, cols, before, d, cell, seen, stamp):
+            loop_count += 1
+    return loop_count
+
+# Per-worker view of the shared jump table, set up by _attach_jump_table
+_shared = {}
+
+def _attach_jump_table(name, cells, cols):
+    shm = shared_memory.SharedMemory(name=name)
+    table = shm.buf.cast('i')
+    _shared['shm'] = shm
+    _shared['jumps'] = [table[d * cells:(d + 1) * cells] for d in range(4)]
+    _shared['cols'] = cols
+    _shared['seen'] = array('i', [0]) * (cells * 4)
+    _shared['stamp'] = 0
+
+def _count_shard(candidates):
+    jumps, cols, seen = _shared['jumps'], _shared['cols'], _shared['seen']
+    loop_count = 0
+    for cell, before, d in candidates:
+        _shared['stamp'] += 1
+        if walks_into_loop(jumps, cols, before, d, cell, seen, _shared['stamp']):
+            loop_count += 1
+    return loop_count
+
+def count_loops_parallel(jumps, cols, path, workers):
+    """
+    Runs the obstacle trials for path in a process pool. The jump table is
+    copied once into shared memory that workers map read-only; only the
+    candidate shards are sent per task.
+    """
+    cells = len(jumps[0])
+    shm = shared_memory.SharedMemory(create=True, size=4 * cells * jumps[0].itemsize)
+    try:
+        table = shm.buf.cast('i')
+        for d in range(4):
+            table[d * cells:(d + 1) * cells] = memoryview(jumps[d])
+        table.release()
+
+        # Interleave shards so expensive stretches of the path are spread out
+        shards = [path[i::workers * 4] for i in range(workers * 4)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_jump_table,
+                                 initargs=(shm.name, cells, cols)) as pool:
+            return sum(pool.map(_count_shard, shards))
+    finally:
+        shm.close()
+        shm.unlink()
+
+def count_loop_obstacles_brute_force(grid):
+    """
+    Reference implementation: re-simulates from the start for every empty cell.
+    """
     loop_count = 0
     rows = len(grid)
     cols = len(grid[0])
@@ -93,8 +287,20 @@ def main():
                 result = simulate(test_grid, extra_obstacle=(r, c))
                 if result == 'loop':
                     loop_count += 1
+    return loop_count
+
+def main(filename="input.txt", workers=1):
+    grid = read_map(filename)
+
+    # For part two:
+    # We want to know how many positions (currently '.') can become an obstruction to cause a loop.
+    loop_count = count_loop_obstacles(grid, workers=workers)
 
     print(loop_count)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for the obstacle search (1 = serial, 0 = all cores)")
+    args = parser.parse_args()
+    main(workers=args.workers)
@@ -1,65 +1,225 @@
-def main():
-    with open("input.txt", "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-
-    def evaluate_expression(nums, ops):
-        # Evaluate left-to-right
-        # nums: list of integers
-        # ops:  list of operators (same length as nums-1)
-        current_val = nums[0]
-        for i, op in enumerate(ops):
-            next_num = nums[i+1]
-            if op == '+':
-                current_val = current_val + next_num
-            elif op == '*':
-                current_val = current_val * next_num
-            else:  # op == '||'
-                current_val = int(str(current_val) + str(next_num))
-        return current_val
-
-    def can_form_target(nums, target):
-        # If only one number
-        if len(nums) == 1:
-            return nums[0] == target
-
-        operators = ['+', '*', '||']
-        n = len(nums)
-        found_solution = False
-
-        def backtrack(index, ops):
-            # index: which operator slot we are filling (0-based, between nums[index] and nums[index+1])
-            # ops: list of chosen operators so far
-            nonlocal found_solution
-            if found_solution:
-                return  # Early exit if we already found a solution
+import argparse
+import operator
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# An operator knows how to combine two values left-to-right (apply) and how to
+# invert that step given the result and the right operand (undo). undo returns
+# the only possible left value, or None when the step cannot have produced
+# the result, which is what lets the reverse solver prune early.
+Operator = namedtuple("Operator", ["symbol", "apply", "undo"])
+
+def concat_place(num):
+    """
+    Returns the power of ten that num's digits occupy: 10 ** len(str(num)).
+    """
+    place = 10
+    while place <= num:
+        place *= 10
+    return place
+
+def concat(left, num):
+    return left * concat_place(num) + num
+
+def undo_add(target, num):
+    return target - num if target >= num else None
+
+def undo_mul(target, num):
+    return target // num if target % num == 0 else None
+
+def undo_concat(target, num):
+    # target == left * place + num, so its low digits must be exactly num
+    if target < num:
+        return None
+    left, low = divmod(target, concat_place(num))
+    return left if low == num else None
+
+ADD = Operator('+', operator.add, undo_add)
+MUL = Operator('*', operator.mul, undo_mul)
+CONCAT = Operator('||', concat, undo_concat)
+
+PART_ONE_OPERATORS = (ADD, MUL)
+PART_TWO_OPERATORS = (ADD, MUL, CONCAT)
+
+def can_calibrate(target, nums, operators=PART_TWO_OPERATORS):
+    """
+    Returns True if inserting operators between nums (evaluated left-to-right)
+    can produce target.
+    Works backwards from the target: each operator's undo either yields the
+    value the prefix must have produced or rules the branch out immediately.
+    """
+    if 0 in nums[1:]:
+        # A zero operand makes undo ambiguous (x * 0 == 0 for every x)
+        return can_calibrate_forward(target, nums, operators)
+
+    first = nums[0]
+    stack = [(target, len(nums) - 1)]
+    while stack:
+        value, i = stack.pop()
+        if i == 0:
+            if value == first:
+                return True
+            continue
+        num = nums[i]
+        for op in operators:
+            previous = op.undo(value, num)
+            if previous is not None:
+                stack.append((previous, i - 1))
+    return False
+
+def can_calibrate_forward(target, nums, operators=PART_TWO_OPERATORS):
+    """
+    Forward search over the set of reachable prefix values.
+    """
+    values = {nums[0]}
+    for num in nums[1:]:
+        values = {op.apply(value, num) for value in values for op in operators}
+    return target in values
+
+def evaluate_expression(nums, ops):
+    # Evaluate left-to-right
+    # nums: list of integers
+    # ops:  list of operators (same length as nums-1)
+    current_val = nums[0]
+    for i, op in enumerate(ops):
+        next_num = nums[i+1]
+        if op == '+':
+            current_val = current_val + next_num
+        elif op == '*':
+            current_val = current_val * next_num
+        else:  # op == '||'
+            current_val = int(str(current_val) + str(next_num))
+    return current_val
 
-            if index == n - 1:
-                # All operators chosen, evaluate
-                val = evaluate_expression(nums, ops)
-                if val == target:
-                    found_solution = True
+def can_form_target(nums, target):
+    """
+    Reference implementation: tries every operator combination.
+    """
+    # If only one number
+    if len(nums) == 1:
+        return nums[0] == target
+
+    operators = ['+', '*', '||']
+    n = len(nums)
+    found_solution = False
+
+    def backtrack(index, ops):
+        # index: which operator slot we are filling (0-based, between nums[index] and nums[index+1])
+        # ops: list of chosen operators so far
+        nonlocal found_solution
+        if found_solution:
+            return  # Early exit if we already found a solution
+
+        if index == n - 1:
+            # All operators chosen, evaluate
+            val = evaluate_expression(nums, ops)
+            if val == target:
+                found_solution = True
+            return
+
+        for op in operators:
+            ops.append(op)
+            backtrack(index + 1, ops)
+            ops.pop()
+            if found_solution:
                 return
 
-            for op in operators:
-                ops.append(op)
-                backtrack(index + 1, ops)
-                ops.pop()
-                if found_solution:
-                    return
+    backtrack(0, [])
+    return found_solution
+
+def parse_equation(line):
+    test_value_str, nums_str = line.split(":")
+    return int(test_value_str.strip()), list(map(int, nums_str.strip().split()))
 
-        backtrack(0, [])
-        return found_solution
+def iter_chunks(filename, chunk_lines=10000):
+    """
+    Lazily yields lists of up to chunk_lines non-empty lines from the file.
+    """
+    with open(filename, "r") as f:
+        chunk = []
+        for line in f:
+            line = line.strip()
+            if line:
+                chunk.append(line)
+                if len(chunk) == chunk_lines:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
 
+def chunk_total(lines, operators=PART_TWO_OPERATORS):
+    """
+    Sums the test values of the calibratable equations in a chunk.
+    Returns (total, line count, seconds spent).
+    """
+    start = time.perf_counter()
     total = 0
     for line in lines:
-        test_value_str, nums_str = line.split(":")
-        test_value = int(test_value_str.strip())
-        nums = list(map(int, nums_str.strip().split()))
-
-        if can_form_target(nums, test_value):
+        test_value, nums = parse_equation(line)
+        if can_calibrate(test_value, nums, operators):
             total += test_value
+    return total, len(lines), time.perf_counter() - start
+
+def report_progress(chunks, lines, total, chunk_lines, chunk_seconds, started):
+    elapsed = time.perf_counter() - started
+    chunk_rate = chunk_lines / chunk_seconds if chunk_seconds else float("inf")
+    print(f"chunk {chunks}: {lines} lines, {lines / elapsed:,.0f} lines/s overall, "
+          f"{chunk_rate:,.0f} lines/s this chunk, running total {total}", file=sys.stderr)
+
+def calibration_total(filename, operators=PART_TWO_OPERATORS, workers=1, chunk_lines=10000,
+                      progress=False):
+    """
+    Streams the equations in chunks and returns the total calibration result.
+    With workers > 1 the chunks are spread over a process pool; at most two
+    chunks per worker are in flight, so memory stays bounded however large
+    the file is. workers=0 uses every core.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = lines = chunks = 0
+    started = time.perf_counter()
+
+    def collect(result):
+        nonlocal total, lines, chunks
+        chunk_sum, chunk_lines_done, seconds = result
+        total += chunk_sum
+        lines += chunk_lines_done
+        chunks += 1
+        if progress:
+            report_progress(chunks, lines, total, chunk_lines_done, seconds, started)
+
+    if workers <= 1:
+        for chunk in iter_chunks(filename, chunk_lines):
+            collect(chunk_total(chunk, operators))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in iter_chunks(filename, chunk_lines):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future.result())
+            pending.add(pool.submit(chunk_total, chunk, operators))
+        for future in pending:
+            collect(future.result())
+    return total
 
+def main(filename="input.txt", operators=PART_TWO_OPERATORS, workers=1, chunk_lines=10000,
+         progress=False):
+    total = calibration_total(filename, operators, workers, chunk_lines, progress)
     print(total)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (1 = serial, 0 = all cores)")
+    parser.add_argument("--chunk-lines", type=int, default=10000, help="equations per chunk")
+    parser.add_argument("--progress", action="store_true", help="report per-chunk throughput")
+    args = parser.parse_args()
+    main(operators=PART_ONE_OPERATORS if args.part == 1 else PART_TWO_OPERATORS,
+         workers=args.workers, chunk_lines=args.chunk_lines,
+         progress=args.progress)
@@ -0,0 +1,114 @@
+import argparse
+import heapq
+
+def read_disk_map(filename):
+    with open(filename, 'r') as f:
+        return f.read().strip()
+
+def parse_disk_map(disk_map):
+    """
+    Splits the dense disk map into run-length spans without expanding it.
+    Returns (files, gaps): files[id] is the (start, length) of file id and
+    gaps[i] the (start, length) of the free space right after file i.
+    """
+    files = []
+    gaps = []
+    position = 0
+    for i, ch in enumerate(disk_map):
+        length = ord(ch) - ord('0')
+        if not 0 <= length <= 9:
+            raise ValueError(f"Invalid input character: {ch!r}")
+        if i % 2 == 0:
+            files.append((position, length))
+        else:
+            gaps.append((position, length))
+        position += length
+    return files, gaps
+
+def span_checksum(file_id, start, length):
+    # file_id * (start + start+1 + ... + start+length-1)
+    return file_id * (start * length + length * (length - 1) // 2)
+
+def compact_blocks(files, gaps):
+    """
+    Part one: moves blocks one at a time from the end of the disk into the
+    leftmost free block. Returns the checksum.
+
+    Works span by span: each gap, left to right, is filled from the
+    rightmost file that still has blocks to move, and every filled stretch
+    is added to the checksum arithmetically.
+    """
+    remaining = [length for _, length in files]
+    right = len(files) - 1
+    checksum = 0
+    for i, (position, space) in enumerate(gaps):
+        if i >= right:
+            break
+        while space and i < right:
+            moved = min(space, remaining[right])
+            checksum += span_checksum(right, position, moved)
+            remaining[right] -= moved
+            position += moved
+            space -= moved
+            if remaining[right] == 0:
+                right -= 1
+    for file_id in range(right + 1):
+        checksum += span_checksum(file_id, files[file_id][0], remaining[file_id])
+    return checksum
+
+def compact_files(files, gaps):
+    """
+    Part two: moves each whole file, highest id first, into the leftmost gap
+    to its left that can hold it. Returns the checksum.
+
+    Gaps are indexed by length in min-heaps of start positions (lengths 1-9,
+    longer only where zero-length files join gaps), so the leftmost gap that
+    fits a file is the smallest top among the heaps for lengths >= the
+    file's length. What is left of a used gap goes back
+    into the heap for its new length. Space freed by a moved file is never
+    indexed: every file still to move lies to its left.
+    """
+    # Gaps on either side of a zero-length file form one free span
+    spans = []
+    for start, length in gaps:
+        if spans and spans[-1][0] + spans[-1][1] == start:
+            spans[-1][1] += length
+        elif length:
+            spans.append([start, length])
+
+    heaps = [[] for _ in range(max([10] + [length + 1 for _, length in spans]))]
+    for start, length in spans:
+        heaps[length].append(start)
+    for heap in heaps:
+        heapq.heapify(heap)
+
+    checksum = 0
+    for file_id in range(len(files) - 1, -1, -1):
+        start, length = files[file_id]
+        if not length:
+            continue
+        best_start, best_length = start, 0
+        for gap_length in range(length, len(heaps)):
+            heap = heaps[gap_length]
+            if heap and heap[0] < best_start:
+                best_start, best_length = heap[0], gap_length
+        if best_length:
+            heapq.heappop(heaps[best_length])
+            if best_length > length:
+                heapq.heappush(heaps[best_length - length], best_start + length)
+            start = best_start
+        checksum += span_checksum(file_id, start, length)
+    return checksum
+
+def main(filename='input.txt', part=2):
+    files, gaps = parse_disk_map(read_disk_map(filename))
+    if part == 1:
+        print(compact_blocks(files, gaps))
+    else:
+        print(compact_files(files, gaps))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    args = parser.parse_args()
+    main(part=args.part)
@@ -1,5 +1,23 @@
+import argparse
+import os
+import sys
 from functools import lru_cache
 
+try:
+    import numpy as np
+except ImportError:  # only needed for the vectorized ratings engine
+    np = None
+
+try:
+    from grid import Grid
+except ImportError:
+    # Run as a script from its own directory, like the other days: grid.py
+    # is in the parent directory. Importers get the plain import above.
+    if __name__ != "__main__":
+        raise
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from grid import Grid
+
 def read_grid(filename):
     """
     Reads the topographic map from the given filename.
@@ -66,14 +84,92 @@ def compute_trailhead_ratings(grid):
 
     return total_rating
 
-def main():
+# Any two 9s reachable from the same cell are at most 18 rows and 18 columns
+# apart, so numbering 9s by (row mod 19, column mod 19) never gives two of
+# them the same bit and keeps every bitset within 361 bits.
+TRAIL_SPAN = 19
+
+def _nine_bit(r, c):
+    return (r % TRAIL_SPAN) * TRAIL_SPAN + c % TRAIL_SPAN
+
+def trail_totals(grid):
+    """
+    Returns (total score, total rating) over all trailheads of a Grid of
+    height digits, without recursion.
+
+    The grid's sentinel border never continues a trail, so neighbors need
+    no bounds checks. Working down from 9 to 1, each cell's path count is
+    added to its neighbors one step lower and its set of reachable 9s, kept
+    as a small int bitset (see _nine_bit), is ORed into theirs; a bitset is
+    dropped once pushed.
+    """
+    heights = grid.data
+    by_height = [grid.find_all(str(height)) for height in range(10)]
+
+    offsets = grid.neighbors4
+    ratings = [0] * len(heights)
+    reach = [0] * len(heights)
+    for i in by_height[9]:
+        ratings[i] = 1
+        reach[i] = 1 << _nine_bit(*grid.position(i))
+    for height in range(9, 0, -1):
+        lower = ord('0') + height - 1
+        # Push each cell's counts down to its neighbors one step lower, so
+        # cells no 9 can be reached from are never expanded
+        for j in by_height[height]:
+            paths = ratings[j]
+            if not paths:
+                continue
+            nines = reach[j]
+            for offset in offsets:
+                i = j + offset
+                if heights[i] == lower:
+                    ratings[i] += paths
+                    reach[i] |= nines
+            reach[j] = 0  # no longer needed once pushed
+
+    trailheads = by_height[0]
+    total_score = sum(bin(reach[i]).count("1") for i in trailheads)
+    total_rating = sum(ratings[i] for i in trailheads)
+    return total_score, total_rating
+
+def trail_ratings_array(grid):
+    """
+    Vectorized form of the rating pass: the path counts for each height are
+    the sum of the four shifted count arrays, masked to the cells of that
+    height. Returns the total rating. Requires NumPy.
+    """
+    heights = np.pad(np.array(grid, dtype=np.int8), 1, constant_values=-1)
+    counts = (heights == 9).astype(np.int64)
+    for height in range(8, -1, -1):
+        # Only cells one step higher keep their counts as sources
+        sources = np.where(heights == height + 1, counts, 0)
+        step = np.zeros_like(counts)
+        step[1:-1, 1:-1] = (sources[:-2, 1:-1] + sources[2:, 1:-1]
+                            + sources[1:-1, :-2] + sources[1:-1, 2:])
+        counts = np.where(heights == height, step, 0)
+    return int(counts.sum())
+
+def main(filename='input.txt', part=2, engine=None):
     """
     Main function to execute the program.
-    Reads the grid, computes the sum of trailhead ratings, and prints the result.
+    Reads the grid and prints the sum of trailhead scores (part 1) or
+    ratings (part 2). engine is "flat" (iterative, both parts), "array"
+    (NumPy, ratings only) or "recursive" (memoized reference, ratings only);
+    by default the flat engine is used.
     """
-    grid = read_grid('input.txt')
-    total_rating = compute_trailhead_ratings(grid)
-    print(total_rating)
+    if part == 1 or engine in (None, "flat"):
+        total_score, total_rating = trail_totals(Grid.from_file(filename))
+        print(total_score if part == 1 else total_rating)
+    elif engine == "array":
+        print(trail_ratings_array(read_grid(filename)))
+    else:
+        print(compute_trailhead_ratings(read_grid(filename)))
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="input.txt", help="puzzle input file")
+    parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    parser.add_argument("--engine", choices=("flat", "array", "recursive"))
+    args = parser.parse_args()
+    main(args.input, part=args.part, engine=args.engine)
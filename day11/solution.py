@@ -1,4 +1,29 @@
+import argparse
+from bisect import bisect_right
 from collections import Counter
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # only needed for modular counts in BlinkEngine
+    np = None
+
+# Powers of ten for digit counting and splitting; extended on demand
+POWERS_OF_TEN = [10 ** i for i in range(20)]
+
+# Upper bound on memoized stone transitions, shared across blinks and runs
+TRANSITION_CACHE_SIZE = 1 << 16
+
+# Exact counts grow by about 0.18 digits per blink; past this many blinks
+# exact stepping takes minutes, so larger counts need a modulus
+MAX_EXACT_BLINKS = 10_000
+
+# Cost model for modular counts, measured on a 3,811-value core: one sparse
+# step costs about SPARSE_STEP_SECONDS + SPARSE_EDGE_SECONDS per transition,
+# one dense n x n modular matrix product about DENSE_MATMUL_SECONDS * n**3
+SPARSE_STEP_SECONDS = 4e-6
+SPARSE_EDGE_SECONDS = 8e-9
+DENSE_MATMUL_SECONDS = 5.5e-11
 
 def read_initial_stones(filename):
     """
@@ -11,55 +36,336 @@ def read_initial_stones(filename):
         stones = list(map(int, content.split()))
     return stones
 
+def digit_count(n):
+    """
+    Returns the number of decimal digits of a non-negative integer.
+    """
+    while n >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, n) or 1
+
 def split_number(n):
     """
     Splits a number with an even number of digits into two halves.
-    Leading zeros in the second half are removed by converting to int.
+    Leading zeros in the second half vanish naturally since the halves are
+    computed arithmetically.
+    """
+    digits = digit_count(n)
+    return divmod(n, POWERS_OF_TEN[digits - digits // 2])
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def blink(stone):
+    """
+    Returns the stones a single stone turns into after one blink.
     """
-    s = str(n)
-    mid = len(s) // 2
-    left = int(s[:mid]) if s[:mid] else 0
-    right = int(s[mid:]) if s[mid:] else 0
-    return left, right
+    if stone == 0:
+        # Rule 1: Replace 0 with 1
+        return (1,)
+    digits = digit_count(stone)
+    if digits % 2 == 0:
+        # Rule 2: Split the number into two halves
+        return divmod(stone, POWERS_OF_TEN[digits // 2])
+    # Rule 3: Multiply the number by 2024
+    return (stone * 2024,)
 
 def simulate_blinks(initial_stones, total_blinks):
     """
     Simulates the transformation of stones over a given number of blinks.
-    Uses a Counter to efficiently track the frequency of each unique stone number.
+    Tracks the frequency of each unique stone number, and looks each
+    stone's children up in the shared transition memo.
     """
-    # Initialize the Counter with the initial stones
-    stone_counts = Counter(initial_stones)
-    
-    for blink in range(1, total_blinks + 1):
-        new_stone_counts = Counter()
+    stone_counts = dict(Counter(initial_stones))
+
+    for blink_number in range(1, total_blinks + 1):
+        new_stone_counts = {}
+        get = new_stone_counts.get
         for stone, count in stone_counts.items():
-            if stone == 0:
-                # Rule 1: Replace 0 with 1
-                new_stone_counts[1] += count
-            elif len(str(stone)) % 2 == 0:
-                # Rule 2: Split the number into two halves
-                left, right = split_number(stone)
-                new_stone_counts[left] += count
-                new_stone_counts[right] += count
-            else:
-                # Rule 3: Multiply the number by 2024
-                multiplied = stone * 2024
-                new_stone_counts[multiplied] += count
+            for child in blink(stone):
+                new_stone_counts[child] = get(child, 0) + count
         stone_counts = new_stone_counts
         # Optional: Uncomment the following line to monitor progress
-        # print(f"After blink {blink}: {sum(stone_counts.values())} stones")
-    
+        # print(f"After blink {blink_number}: {sum(stone_counts.values())} stones")
+
     return sum(stone_counts.values())
 
-def main():
+def closed_stone_set(initial_stones, max_states=1_000_000):
+    """
+    Returns every stone value reachable from the initial stones by blinking,
+    in discovery order. Raises ValueError if there are more than max_states.
+    """
+    seen = dict.fromkeys(initial_stones)
+    frontier = list(seen)
+    while frontier:
+        stone = frontier.pop()
+        for child in blink(stone):
+            if child not in seen:
+                seen[child] = None
+                frontier.append(child)
+                if len(seen) > max_states:
+                    raise ValueError(f"More than {max_states} distinct stone values are reachable")
+    return list(seen)
+
+def recurrent_core(states):
+    """
+    Returns the set of stone values reachable from some cycle of the blink
+    graph (Tarjan's SCC algorithm, iteratively). Every other value can only
+    be visited during the first few blinks, because outside the core the
+    graph has no cycles.
+    """
+    index, low = {}, {}
+    stack, on_stack = [], set()
+    on_cycle = set()
+    counter = 0
+    for root in states:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(blink(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(blink(child))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in blink(node):
+                        on_cycle.update(component)
+
+    core = set(on_cycle)
+    frontier = list(core)
+    while frontier:
+        for child in blink(frontier.pop()):
+            if child not in core:
+                core.add(child)
+                frontier.append(child)
+    return core
+
+def matmul_mod(a, b, modulus):
+    """
+    Exact (a @ b) % modulus for non-negative int64 arrays with entries below
+    modulus <= 2**31. b is split into limbs small enough that every float64
+    partial sum stays below 2**53, so BLAS can do the heavy lifting exactly.
+    """
+    n = a.shape[1]
+    block = min(n, 1 << 12)
+    limb_bits = 53 - (modulus - 1).bit_length() - block.bit_length()
+    mask = (1 << limb_bits) - 1
+    a = a.astype(np.float64)
+    result = np.zeros((a.shape[0],) + b.shape[1:], dtype=np.int64)
+    remaining = b.copy()
+    scale = 1
+    while remaining.any():
+        limb = (remaining & mask).astype(np.float64)
+        remaining >>= limb_bits
+        partial = np.zeros_like(result)
+        for start in range(0, n, block):
+            product = a[:, start:start + block] @ limb[start:start + block]
+            partial += np.rint(product).astype(np.int64) % modulus
+        result = (result + (partial % modulus) * scale) % modulus
+        scale = (scale << limb_bits) % modulus
+    return result
+
+class BlinkEngine:
+    """
+    Answers stone counts for very large or many blink counts at once.
+
+    The values reachable from the initial stones form a closed set. Values
+    outside its recurrent core only appear during the first few blinks, so
+    those are simulated directly; after that the counts evolve by a fixed
+    transition matrix over the core, and large blink counts are answered by
+    stepping the core vector modulo a given modulus with one sparse
+    bincount per blink, or by repeated squaring of the dense matrix where
+    the cost model says that wins (very large blink counts). Exact counts
+    have hundreds of thousands of digits at 10^6 blinks, so without a
+    modulus the vector is stepped exactly and at most MAX_EXACT_BLINKS
+    blinks are accepted.
+    """
+
+    def __init__(self, initial_stones, max_states=1_000_000):
+        self.initial_counts = Counter(initial_stones)
+        self.core = sorted(recurrent_core(closed_stone_set(initial_stones, max_states)))
+        self.core_index = {stone: i for i, stone in enumerate(self.core)}
+        self.children = [[self.core_index[child] for child in blink(stone)] for stone in self.core]
+        # The transitions as parallel (parent, child) index arrays
+        self.edges = [(parent, child) for parent, children in enumerate(self.children)
+                      for child in children]
+
+    def transition_matrix(self):
+        """
+        Dense matrix M over the core with counts_next = M @ counts.
+        """
+        n = len(self.core)
+        matrix = np.zeros((n, n), dtype=np.int64)
+        for parent, children in enumerate(self.children):
+            for child in children:
+                matrix[child, parent] += 1
+        return matrix
+
+    def counts(self, blink_counts, modulus=None, method=None):
+        """
+        Returns {t: number of stones after t blinks} for every t in blink_counts,
+        reduced modulo modulus if one is given (modulus <= 2**31, needs NumPy).
+        All requested counts share one pass over the blinks, or one chain of
+        matrix squarings when the modular cost model prefers squaring.
+        method forces "step" (sparse stepping) or "square" (repeated
+        squaring) in modular mode. Raises ValueError for more than
+        MAX_EXACT_BLINKS blinks without a modulus.
+        """
+        check_exact_blinks(blink_counts, modulus)
+        if modulus is not None and np is None:
+            raise RuntimeError("Modular blink counts need NumPy")
+        if modulus is not None and not 1 < modulus <= 1 << 31:
+            raise ValueError("modulus must be between 2 and 2**31")
+        wanted = sorted(set(blink_counts))
+        answers = {}
+
+        # Simulate until every stone is inside the core
+        stone_counts = dict(self.initial_counts)
+        t = 0
+        while wanted and t <= wanted[-1]:
+            if t in wanted:
+                total = sum(stone_counts.values())
+                answers[t] = total if modulus is None else total % modulus
+            if all(stone in self.core_index for stone in stone_counts):
+                break
+            new_stone_counts = {}
+            for stone, count in stone_counts.items():
+                for child in blink(stone):
+                    new_stone_counts[child] = new_stone_counts.get(child, 0) + count
+            stone_counts = new_stone_counts
+            t += 1
+
+        offsets = [w - t for w in wanted if w > t]
+        if offsets:
+            vector = [0] * len(self.core)
+            for stone, count in stone_counts.items():
+                vector[self.core_index[stone]] = count
+            if modulus is None:
+                results = self._step_exact(vector, offsets)
+            elif method == "square" or method is None and self.prefer_squaring(offsets[-1]):
+                results = self._power_mod(vector, offsets, modulus)
+            else:
+                results = self._step_mod(vector, offsets, modulus)
+            for offset, total in zip(offsets, results):
+                answers[t + offset] = total
+
+        return {w: answers[w] for w in blink_counts}
+
+    def _step_exact(self, vector, offsets):
+        results = []
+        children = self.children
+        step = 0
+        for offset in offsets:
+            while step < offset:
+                new_vector = [0] * len(vector)
+                for parent, count in enumerate(vector):
+                    if count:
+                        for child in children[parent]:
+                            new_vector[child] += count
+                vector = new_vector
+                step += 1
+            results.append(sum(vector))
+        return results
+
+    def prefer_squaring(self, blinks):
+        """
+        Whether repeated squaring is estimated to beat sparse stepping for
+        this many blinks past the transient (about 3 * 10^6 for a 3,811-value
+        core).
+        """
+        n = len(self.core)
+        stepping = blinks * (SPARSE_STEP_SECONDS + SPARSE_EDGE_SECONDS * len(self.edges))
+        squaring = blinks.bit_length() * DENSE_MATMUL_SECONDS * n ** 3
+        return squaring < stepping
+
+    def _step_mod(self, vector, offsets, modulus):
+        # One sparse matvec per blink: each child sums its parents' counts.
+        # The float64 bincount is exact, as each sum stays far below 2**53.
+        parents, children = (np.array(side, dtype=np.intp) for side in zip(*self.edges))
+        n = len(self.core)
+        vector = np.array([count % modulus for count in vector], dtype=np.int64)
+        results = []
+        step = 0
+        for offset in offsets:
+            while step < offset:
+                vector = np.bincount(children, weights=vector[parents], minlength=n)
+                vector = vector.astype(np.int64) % modulus
+                step += 1
+            results.append(int(vector.sum()) % modulus)
+        return results
+
+    def _power_mod(self, vector, offsets, modulus):
+        # Apply M^(2^k) to every column whose offset has bit k set; the powers
+        # are squared once and shared by all requested blink counts.
+        power = self.transition_matrix() % modulus
+        start = np.array([count % modulus for count in vector], dtype=np.int64)
+        columns = np.repeat(start[:, None], len(offsets), axis=1)
+        offsets_array = np.array(offsets, dtype=np.int64)
+        bit = 0
+        while True:
+            selected = np.nonzero((offsets_array >> bit) & 1)[0]
+            if selected.size:
+                columns[:, selected] = matmul_mod(power, columns[:, selected], modulus)
+            bit += 1
+            if (1 << bit) > offsets[-1]:
+                break
+            power = matmul_mod(power, power, modulus)
+        return [int(total) for total in columns.sum(axis=0) % modulus]
+
+def check_exact_blinks(blink_counts, modulus):
+    """
+    Raises ValueError if exact counts are asked for more than
+    MAX_EXACT_BLINKS blinks.
+    """
+    if modulus is None and max(blink_counts, default=0) > MAX_EXACT_BLINKS:
+        raise ValueError(f"Exact counts are limited to {MAX_EXACT_BLINKS} blinks; "
+                         f"pass a modulus for more")
+
+def main(filename='input.txt', blink_counts=(75,), modulus=None, method=None):
     """
     Main function to execute the program.
-    Reads the grid, computes the sum of trailhead ratings, and prints the result.
+    Reads the stones and prints the stone count after each requested number
+    of blinks (just the count for a single one).
     """
-    initial_stones = read_initial_stones('input.txt')
-    total_blinks = 75
-    final_stone_count = simulate_blinks(initial_stones, total_blinks)
-    print(final_stone_count)
+    check_exact_blinks(blink_counts, modulus)
+    initial_stones = read_initial_stones(filename)
+    if len(blink_counts) == 1 and modulus is None:
+        final_stone_count = simulate_blinks(initial_stones, blink_counts[0])
+        print(final_stone_count)
+        return
+    counts = BlinkEngine(initial_stones).counts(blink_counts, modulus, method)
+    for total_blinks, count in counts.items():
+        print(f"{total_blinks}: {count}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blinks", type=int, nargs="+", default=[75])
+    parser.add_argument("--modulus", type=int, help="report counts modulo this (<= 2**31)")
+    parser.add_argument("--method", choices=("step", "square"),
+                        help="force sparse stepping or matrix squaring with --modulus")
+    args = parser.parse_args()
+    try:
+        main(blink_counts=args.blinks, modulus=args.modulus, method=args.method)
+    except ValueError as error:
+        parser.error(str(error))
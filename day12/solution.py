@@ -1,5 +1,19 @@
+import argparse
+import os
+import sys
+from array import array
 from collections import defaultdict, deque
 
+try:
+    from grid import Grid
+except ImportError:
+    # Run as a script from its own directory, like the other days: grid.py
+    # is in the parent directory. Importers get the plain import above.
+    if __name__ != "__main__":
+        raise
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from grid import Grid
+
 def read_input(file_path):
     with open(file_path, 'r') as file:
         return [line.strip() for line in file]
@@ -48,8 +62,242 @@ def calculate_total_price(map_data):
 
     return total_price
 
-if __name__ == "__main__":
-    input_file = "input.txt"
-    map_data = read_input(input_file)
-    total_price = calculate_total_price(map_data)
+def _find(parent, i):
+    # Path halving keeps the trees shallow without recursion
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def label_regions(map_data):
+    """
+    Labels every region in one row-major sweep with union-find over a flat
+    array, accumulating area, perimeter and side count as it goes.
+    map_data is a Grid or a list of rows. Returns a list of
+    (plant, area, perimeter, sides), one per region.
+
+    The Grid's sentinel border makes neighbor lookups plain offsets with no
+    bounds checks. Each cell is
+    merged with its left and upper neighbors, and its contributions are
+    added to its current root; merging two roots adds their totals. The
+    number of sides of a region equals its number of corners, and a cell has
+    a corner towards a diagonal when both orthogonal neighbors on that side
+    differ from it (convex) or both match but the diagonal does not (concave).
+    """
+    if not isinstance(map_data, Grid):
+        map_data = Grid.from_lines(map_data)
+    rows, cols, width = map_data.rows, map_data.cols, map_data.width
+    grid = map_data.data
+
+    size = len(grid)
+    parent = array('i', range(size))
+    area = array('q', bytes(8 * size))
+    perimeter = array('q', bytes(8 * size))
+    corners = array('q', bytes(8 * size))
+
+    def union(a, b):
+        a, b = _find(parent, a), _find(parent, b)
+        if a != b:
+            parent[b] = a
+            area[a] += area[b]
+            perimeter[a] += perimeter[b]
+            corners[a] += corners[b]
+
+    up, down = -width, width
+    for r in range(1, rows + 1):
+        for i in range(r * width + 1, r * width + cols + 1):
+            plant = grid[i]
+            same_up = grid[i + up] == plant
+            same_down = grid[i + down] == plant
+            same_left = grid[i - 1] == plant
+            same_right = grid[i + 1] == plant
+
+            if same_left:
+                union(i - 1, i)
+            if same_up:
+                union(i + up, i)
+
+            cell_corners = 0
+            if same_up:
+                if same_left and grid[i + up - 1] != plant:
+                    cell_corners += 1
+                if same_right and grid[i + up + 1] != plant:
+                    cell_corners += 1
+            else:
+                cell_corners += (not same_left) + (not same_right)
+            if same_down:
+                if same_left and grid[i + down - 1] != plant:
+                    cell_corners += 1
+                if same_right and grid[i + down + 1] != plant:
+                    cell_corners += 1
+            else:
+                cell_corners += (not same_left) + (not same_right)
+
+            root = _find(parent, i)
+            area[root] += 1
+            perimeter[root] += 4 - same_up - same_down - same_left - same_right
+            corners[root] += cell_corners
+
+    regions = []
+    for r in range(1, rows + 1):
+        for i in range(r * width + 1, r * width + cols + 1):
+            if parent[i] == i:
+                regions.append((chr(grid[i]), area[i], perimeter[i], corners[i]))
+    return regions
+
+def calculate_prices(map_data):
+    """
+    Returns (total price, total price with the bulk discount), i.e. the sums
+    of area * perimeter and area * sides over all regions.
+    """
+    total_price = bulk_price = 0
+    for _, area, perimeter, sides in label_regions(map_data):
+        total_price += area * perimeter
+        bulk_price += area * sides
+    return total_price, bulk_price
+
+def iter_rows(file_path):
+    """
+    Lazily yields the rows of the map as bytes, one line at a time.
+    """
+    with open(file_path, 'rb') as file:
+        for line in file:
+            line = line.rstrip(b"\r\n")
+            if line:
+                yield line
+
+def _corner(plant, horizontal, vertical, diagonal):
+    # A cell has a corner at a vertex when both orthogonal neighbors there
+    # differ from it (convex) or both match but the diagonal does not (concave)
+    if horizontal != plant:
+        return vertical != plant
+    return vertical == plant and diagonal != plant
+
+def iter_closed_regions(rows):
+    """
+    Streams the map row by row and yields (plant, area, perimeter, sides)
+    for each region as soon as it is closed, i.e. as soon as a row arrives
+    that none of its cells reach. Only the previous row, its region labels
+    and the statistics of the regions touching it are kept, so memory is
+    O(width) however many rows there are.
+
+    Each row is labeled against the previous one (cells join their left
+    neighbor's label, and labels merge with union-find when a cell matches
+    the cell above). Perimeter is counted per unit edge and sides per
+    vertex, using the 2x2 window of cells around every vertex between the
+    two rows. Rows are bytes or str; a sentinel row of zero bytes closes the
+    regions on the last real row.
+    """
+    prev = prev_labels = None
+    parent = {}
+    stats = {}          # root label -> [plant, area, perimeter, corners]
+    next_label = 0
+
+    def find(label):
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a != b:
+            parent[b] = a
+            kept, merged = stats[a], stats.pop(b)
+            kept[1] += merged[1]
+            kept[2] += merged[2]
+            kept[3] += merged[3]
+
+    rows = iter(rows)
+    while True:
+        row = next(rows, None)
+        if row is None:
+            if prev is None:
+                return
+            cur = bytes(len(prev))
+        else:
+            if isinstance(row, str):
+                row = row.encode()
+            cur = b"\0" + row + b"\0"
+            if prev is None:
+                prev = bytes(len(cur))
+                prev_labels = [-1] * len(cur)
+            elif len(cur) != len(prev):
+                raise ValueError("All rows of the map must have the same width")
+        width = len(cur)
+
+        # Label the row, merging with the regions of the row above
+        labels = [-1] * width
+        for j in range(1, width - 1):
+            plant = cur[j]
+            if plant == 0:
+                continue
+            if cur[j - 1] == plant:
+                labels[j] = labels[j - 1]
+            else:
+                labels[j] = next_label
+                parent[next_label] = next_label
+                stats[next_label] = [chr(plant), 0, 0, 0]
+                next_label += 1
+            if prev[j] == plant:
+                union(prev_labels[j], labels[j])
+        roots = [find(label) if label >= 0 else -1 for label in labels]
+        above = [find(label) if label >= 0 else -1 for label in prev_labels]
+
+        for j in range(1, width):
+            a, b, c, d = prev[j - 1], prev[j], cur[j - 1], cur[j]
+            # Area, and the unit edges left of and above the cell at j
+            if d:
+                region = stats[roots[j]]
+                region[1] += 1
+                region[2] += (c != d) + (b != d)
+            if c and c != d:
+                stats[roots[j - 1]][2] += 1
+            if b and b != d:
+                stats[above[j]][2] += 1
+            # Corners at the vertex between columns j - 1 and j
+            if a:
+                stats[above[j - 1]][3] += _corner(a, b, c, d)
+            if b:
+                stats[above[j]][3] += _corner(b, a, d, c)
+            if c:
+                stats[roots[j - 1]][3] += _corner(c, d, a, b)
+            if d:
+                stats[roots[j]][3] += _corner(d, c, b, a)
+
+        # Regions of the row above that no cell of this row reaches are done
+        active = set(roots)
+        for root in set(above):
+            if root >= 0 and root not in active:
+                yield tuple(stats.pop(root))
+        parent = {root: root for root in active if root >= 0}
+        prev, prev_labels = cur, roots
+        if row is None:
+            return
+
+def calculate_prices_streaming(file_path):
+    """
+    Returns (total price, total price with the bulk discount) like
+    calculate_prices, reading the map one row at a time.
+    """
+    total_price = bulk_price = 0
+    for _, area, perimeter, sides in iter_closed_regions(iter_rows(file_path)):
+        total_price += area * perimeter
+        bulk_price += area * sides
+    return total_price, bulk_price
+
+def main(file_path="input.txt", stream=False):
+    if stream:
+        total_price, bulk_price = calculate_prices_streaming(file_path)
+    else:
+        total_price, bulk_price = calculate_prices(Grid.from_file(file_path))
     print(f"Total price of fencing all regions: {total_price}")
+    print(f"Total price with bulk discount: {bulk_price}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", default="input.txt", help="puzzle input file")
+    parser.add_argument("--stream", action="store_true",
+                        help="read the map row by row in O(width) memory")
+    args = parser.parse_args()
+    main(args.input, stream=args.stream)
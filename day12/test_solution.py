@@ -0,0 +1,12 @@
+import random
+
+import pytest
+
+from day12.solution import iter_closed_regions, label_regions
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_streaming_regions_match_labeled_regions(seed):
+    rng = random.Random(seed)
+    rows = ["".join(rng.choice("ABC") for _ in range(12)) for _ in range(10)]
+    assert sorted(iter_closed_regions(rows)) == sorted(label_regions(rows))
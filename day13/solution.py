@@ -1,6 +1,17 @@
 import sys
 import re
 
+try:
+    import numpy as np
+except ImportError:  # the per-machine path below works without it
+    np = None
+
+PRIZE_OFFSET = 10**13
+
+# One whole machine block, so the input is parsed in a single findall
+MACHINE_PATTERN = re.compile(
+    r"Button A: X\+(\d+), Y\+(\d+)\s+Button B: X\+(\d+), Y\+(\d+)\s+Prize: X=(\d+), Y=(\d+)")
+
 def parse_machine(block):
     """
     Parses a single machine block and returns A_x, A_y, B_x, B_y, P_x, P_y
@@ -25,6 +36,72 @@ def parse_machine(block):
                 P_x, P_y = map(int, matches[0])
     return A_x, A_y, B_x, B_y, P_x, P_y
 
+def extended_gcd(a, b):
+    """
+    Iterative extended Euclidean algorithm.
+    Returns (g, x, y) with a * x + b * y == g == gcd(a, b).
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    return old_r, old_x, old_y
+
+def solve_degenerate(A_x, A_y, B_x, B_y, Q_x, Q_y):
+    """
+    Minimum cost when the buttons are parallel (D == 0), in O(log) time.
+    Returns the minimum cost if possible, otherwise returns None.
+
+    The presses only move the claw along one line, so a single axis
+    equation u * a + v * b = q decides everything. Its integer solutions are
+    a = a0 + k * v', b = b0 - k * u' (u', v' = u / g, v / g), non-negativity
+    bounds k to an interval, and the cost 3a + b is linear in k, so the
+    optimum sits at one end of that interval.
+    """
+    if A_x or B_x:
+        u, v, q = A_x, B_x, Q_x
+    elif A_y or B_y:
+        if Q_x != 0:
+            return None
+        u, v, q = A_y, B_y, Q_y
+    else:
+        # Neither button moves the claw
+        return 0 if Q_x == 0 and Q_y == 0 else None
+
+    g, x0, y0 = extended_gcd(u, v)
+    if q % g != 0:
+        return None  # No solution
+    a0 = x0 * (q // g)
+    b0 = y0 * (q // g)
+    u_s = u // g
+    v_s = v // g
+
+    # a >= 0  <=>  k >= ceil(-a0 / v_s);  b >= 0  <=>  k <= floor(b0 / u_s)
+    k_min = -(a0 // v_s) if v_s else None
+    k_max = b0 // u_s if u_s else None
+    if (v_s == 0 and a0 < 0) or (u_s == 0 and b0 < 0):
+        return None
+    if k_min is not None and k_max is not None and k_min > k_max:
+        return None  # No non-negative solutions
+
+    # cost(k) = 3 * a0 + b0 + k * slope
+    slope = 3 * v_s - u_s
+    if slope > 0 or k_max is None:
+        k = k_min
+    else:
+        k = k_max
+    a = a0 + k * v_s
+    b = b0 - k * u_s
+
+    # Parallel buttons give the same offset on the other axis for every k
+    if a * A_x + b * B_x != Q_x or a * A_y + b * B_y != Q_y:
+        return None
+    return 3 * a + b
+
 def find_min_cost(A_x, A_y, B_x, B_y, Q_x, Q_y):
     """
     Finds the minimum token cost to reach (Q_x, Q_y) using buttons A and B.
@@ -32,69 +109,7 @@ def find_min_cost(A_x, A_y, B_x, B_y, Q_x, Q_y):
     """
     D = A_x * B_y - A_y * B_x
     if D == 0:
-        # Check if the system has infinitely many solutions
-        if (Q_x * B_y != Q_y * B_x):
-            return None  # No solution
-        # Find non-negative integer solutions to A_x * a + B_x * b = Q_x
-        # Minimize 3a + b
-        # This is equivalent to minimizing a and b such that A_x * a + B_x * b = Q_x
-        # To minimize 3a + b, prioritize minimizing 'a' if 3a grows faster
-        # Find a particular solution and parameterize
-        # Since D == 0 and Q_x * B_y == Q_y * B_x, solutions exist
-        # We can express a in terms of b or vice versa
-        # Let's iterate over possible a within a feasible range to find the minimal cost
-        # Given the large Q_x, we need an efficient method
-        # We'll use the Extended Euclidean Algorithm to find a particular solution
-        
-        # Find gcd(A_x, B_x)
-        from math import gcd
-        g = gcd(A_x, B_x)
-        if Q_x % g != 0:
-            return None  # No solution
-        
-        # Simplify the equation
-        A_x_s = A_x // g
-        B_x_s = B_x // g
-        Q_x_s = Q_x // g
-        
-        # Find one solution using the Extended Euclidean Algorithm
-        def extended_gcd(a, b):
-            if b == 0:
-                return a, 1, 0
-            else:
-                g, x, y = extended_gcd(b, a % b)
-                return g, y, x - (a // b) * y
-        
-        _, x0, y0 = extended_gcd(A_x_s, B_x_s)
-        a_particular = x0 * Q_x_s
-        b_particular = y0 * Q_x_s
-        
-        # The general solutions are:
-        # a = a_particular + k * (B_x_s)
-        # b = b_particular - k * (A_x_s)
-        # We need a >=0 and b >=0
-        # Find the range of k that satisfies these constraints
-        k_min = (-a_particular) // B_x_s
-        k_max = b_particular // A_x_s
-        
-        # Adjust k_min and k_max to cover all possible k
-        k_min = max(k_min, 0)
-        k_max = k_max
-        
-        if k_min > k_max:
-            return None  # No non-negative solutions
-        
-        # Iterate through possible k values to find the minimal cost
-        min_cost = float('inf')
-        for k in range(k_min, k_max + 1):
-            a = a_particular + k * B_x_s
-            b = b_particular - k * A_x_s
-            if a < 0 or b < 0:
-                continue
-            cost = 3 * a + b
-            if cost < min_cost:
-                min_cost = cost
-        return min_cost if min_cost != float('inf') else None
+        return solve_degenerate(A_x, A_y, B_x, B_y, Q_x, Q_y)
     else:
         a_num = Q_x * B_y - Q_y * B_x
         b_num = A_x * Q_y - A_y * Q_x
@@ -115,8 +130,75 @@ def find_min_cost(A_x, A_y, B_x, B_y, Q_x, Q_y):
 
         return 3 * a + b
 
-def main_part_two():
+def parse_machines_array(input_data):
+    """
+    Parses every machine in one pass into an (n, 6) integer array with
+    columns A_x, A_y, B_x, B_y, P_x, P_y. Incomplete machines are skipped.
+    """
+    machines = MACHINE_PATTERN.findall(input_data)
+    return np.array(machines, dtype=np.int64).reshape(-1, 6)
+
+def _fits_int64(machines, offset):
+    # The largest intermediate is a cross product like Q_x * B_y
+    if machines.size == 0:
+        return True
+    largest_button = int(machines[:, :4].max())
+    largest_prize = int(machines[:, 4:].max()) + offset
+    return 2 * largest_button * max(largest_prize, largest_button) < 2**62
+
+def _exact_sum(values):
+    # Sums int64 values without overflow by adding high and low halves apart
+    return int((values >> 32).sum()) * 2**32 + int((values & 0xFFFFFFFF).sum())
+
+def total_min_cost_array(machines, offset=PRIZE_OFFSET):
+    """
+    Solves every machine at once with Cramer's rule on whole columns and
+    returns the total minimum token cost.
+    Arithmetic is int64 when the cross products provably fit, Python ints
+    (object arrays) otherwise. Only machines with D == 0 go back to
+    find_min_cost one at a time.
+    """
+    if not _fits_int64(machines, offset):
+        machines = machines.astype(object)
+    A_x, A_y, B_x, B_y, P_x, P_y = machines.T
+    Q_x = P_x + offset
+    Q_y = P_y + offset
+
+    D = A_x * B_y - A_y * B_x
+    singular = D == 0
+    D_safe = np.where(singular, 1, D)
+    a_num = Q_x * B_y - Q_y * B_x
+    b_num = A_x * Q_y - A_y * Q_x
+    solvable = ~singular & (a_num % D_safe == 0) & (b_num % D_safe == 0)
+    a = a_num // D_safe
+    b = b_num // D_safe
+    solvable &= (a >= 0) & (b >= 0)
+    costs = (3 * a + b)[solvable]
+
+    if machines.dtype == object:
+        total = int(costs.sum()) if costs.size else 0
+    else:
+        total = _exact_sum(costs)
+    for row in np.nonzero(singular)[0]:
+        min_cost = find_min_cost(*(int(v) for v in (A_x[row], A_y[row], B_x[row], B_y[row],
+                                                     Q_x[row], Q_y[row])))
+        if min_cost is not None:
+            total += min_cost
+    return total
+
+def main_part_two(engine=None):
+    """
+    Prints the total cost for the prizes moved by 10^13.
+    engine is "batch" (NumPy) or "machine" (one machine at a time); by
+    default the batch path is used when NumPy is available.
+    """
     input_data = sys.stdin.read()
+    if engine is None:
+        engine = "batch" if np is not None else "machine"
+    if engine == "batch":
+        print(total_min_cost_array(parse_machines_array(input_data)))
+        return
+
     # Split the input into blocks separated by two or more newlines
     blocks = re.split(r'\n\s*\n', input_data.strip())
     total_tokens = 0
@@ -125,8 +207,8 @@ def main_part_two():
         if None in [A_x, A_y, B_x, B_y, P_x, P_y]:
             continue  # Skip incomplete machine data
         # Adjust prize positions by adding 10^13 to both X and Y
-        Q_x = P_x + 10**13
-        Q_y = P_y + 10**13
+        Q_x = P_x + PRIZE_OFFSET
+        Q_y = P_y + PRIZE_OFFSET
         min_cost = find_min_cost(A_x, A_y, B_x, B_y, Q_x, Q_y)
         if min_cost is not None:
             total_tokens += min_cost
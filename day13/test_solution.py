@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from day13.solution import find_min_cost
+
+
+def brute_force_min_cost(A_x, A_y, B_x, B_y, Q_x, Q_y, limit):
+    # Tries every press count up to limit
+    best = None
+    for a in range(limit + 1):
+        for b in range(limit + 1):
+            if a * A_x + b * B_x == Q_x and a * A_y + b * B_y == Q_y:
+                cost = 3 * a + b
+                if best is None or cost < best:
+                    best = cost
+    return best
+
+
+def random_degenerate_machine(rng):
+    # Buttons along one direction (p, q), so the determinant is zero
+    p, q = rng.randint(0, 5), rng.randint(0, 5)
+    if rng.random() < 0.8:
+        f_a, f_b = rng.randint(0, 4), rng.randint(0, 4)
+        A_x, A_y, B_x, B_y = f_a * p, f_a * q, f_b * p, f_b * q
+    else:
+        A_x, A_y, B_x, B_y = rng.randint(0, 4) * p, rng.randint(0, 4) * q, 0, 0
+    if rng.random() < 0.7:
+        s = rng.randint(0, 12)
+        Q_x, Q_y = s * p, s * q
+    else:
+        Q_x, Q_y = rng.randint(0, 20), rng.randint(0, 20)
+    return A_x, A_y, B_x, B_y, Q_x, Q_y
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_degenerate_machines_match_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(4000):
+        machine = random_degenerate_machine(rng)
+        assert machine[0] * machine[3] == machine[1] * machine[2]
+        # With non-negative buttons no useful press count exceeds max(Q)
+        expected = brute_force_min_cost(*machine, max(machine[4], machine[5]))
+        assert find_min_cost(*machine) == expected, machine
+
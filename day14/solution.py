@@ -1,5 +1,16 @@
+import argparse
 import re
 
+try:
+    import numpy as np
+except ImportError:  # the tuple-based path below works without it
+    np = None
+
+ROBOT_PATTERN = r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)"
+ROBOT_FIELDS = ("x", "y", "vx", "vy")
+# Blanks out everything but the numbers in "p=x,y v=vx,vy" lines
+ROBOT_SEPARATORS = str.maketrans("pv=,", "    ")
+
 def parse_input(file_path):
     """
     Parses the input file and extracts robot positions and velocities.
@@ -12,7 +23,7 @@ def parse_input(file_path):
     """
     robots = []
     # Regular expression to extract integers from the input lines
-    pattern = re.compile(r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)")
+    pattern = re.compile(ROBOT_PATTERN)
     with open(file_path, 'r') as f:
         for line in f:
             match = pattern.search(line)
@@ -93,7 +104,173 @@ def calculate_safety_factor(robots, t, width, height):
 
     return safety_factor
 
-def main():
+def parse_input_array(file_path):
+    """
+    Parses the input file straight into a NumPy structured array.
+    The labels are blanked out and NumPy's text parser reads all the
+    numbers in one call, four per robot.
+
+    Args:
+        file_path (str): Path to the input file.
+
+    Returns:
+        numpy.ndarray: One record per robot with int64 fields x, y, vx, vy.
+    """
+    with open(file_path, 'r') as f:
+        text = f.read().translate(ROBOT_SEPARATORS)
+    values = np.fromstring(text, dtype=np.int64, sep=' ')
+    dtype = np.dtype([(field, np.int64) for field in ROBOT_FIELDS])
+    return values.reshape(-1, len(ROBOT_FIELDS)).view(dtype).reshape(-1)
+
+def compute_positions_array(robots, t, width, height):
+    """
+    Computes every robot's position after t seconds with wrapping.
+
+    Args:
+        robots (numpy.ndarray): Structured array from parse_input_array.
+        t (int): Time in seconds.
+        width (int): Width of the grid (for wrapping).
+        height (int): Height of the grid (for wrapping).
+
+    Returns:
+        tuple: Arrays (x, y) of new positions.
+    """
+    # Reducing t first keeps vx * t far away from int64 overflow
+    x = (robots["x"] + robots["vx"] * (t % width)) % width
+    y = (robots["y"] + robots["vy"] * (t % height)) % height
+    return x, y
+
+def calculate_safety_factor_array(robots, t, width, height):
+    """
+    Vectorized calculate_safety_factor over a structured robot array.
+
+    Each robot gets a cell of the 3x3 grid formed by the two central lines
+    (sign of its offset from the center on each axis) and a single bincount
+    gives all quadrant counts; the four corner cells are the quadrants.
+
+    Args:
+        robots (numpy.ndarray): Structured array from parse_input_array.
+        t (int): Time in seconds.
+        width (int): Width of the grid (for wrapping).
+        height (int): Height of the grid (for wrapping).
+
+    Returns:
+        int: The safety factor.
+    """
+    x, y = compute_positions_array(robots, t, width, height)
+    cell = (np.sign(x - width // 2) + 1) * 3 + (np.sign(y - height // 2) + 1)
+    counts = np.bincount(cell, minlength=9)
+    return int(counts[0]) * int(counts[2]) * int(counts[6]) * int(counts[8])
+
+def axis_variances(start, velocity, period, batch_elements=1 << 22):
+    """
+    Computes the variance of the robots' coordinate along one axis for every
+    t in one period of that axis, a batch of time steps at a time.
+
+    Args:
+        start (numpy.ndarray): Initial coordinates.
+        velocity (numpy.ndarray): Velocities along the axis.
+        period (int): Size of the axis (positions repeat every period seconds).
+        batch_elements (int): Upper bound on array elements held at once.
+
+    Returns:
+        numpy.ndarray: Variance for t = 0 .. period - 1.
+    """
+    variances = np.empty(period)
+    batch = max(1, batch_elements // max(len(start), 1))
+    for first in range(0, period, batch):
+        times = np.arange(first, min(first + batch, period))[:, None]
+        positions = (start + velocity * times) % period
+        variances[first:first + len(times)] = positions.var(axis=1)
+    return variances
+
+def combine_periods(t_x, width, t_y, height):
+    """
+    Chinese remainder theorem: the t in [0, width * height) with
+    t % width == t_x and t % height == t_y, for coprime width and height.
+    """
+    step = (t_y - t_x) * pow(width, -1, height) % height
+    return t_x + width * step
+
+def find_pattern_time(robots, width, height):
+    """
+    Finds the first time the robots bunch up into the picture.
+
+    x positions repeat every width seconds and y positions every height
+    seconds, so each axis is scanned on its own for its variance minimum
+    and the two residues are combined with the CRT.
+
+    Args:
+        robots (numpy.ndarray): Structured array from parse_input_array.
+        width (int): Width of the grid (for wrapping).
+        height (int): Height of the grid (for wrapping).
+
+    Returns:
+        int: Time in seconds within the first width * height seconds.
+    """
+    t_x = int(np.argmin(axis_variances(robots["x"], robots["vx"], width)))
+    t_y = int(np.argmin(axis_variances(robots["y"], robots["vy"], height)))
+    return combine_periods(t_x, width, t_y, height)
+
+def scan_frames(robots, width, height, metric="variance", batch_elements=1 << 24, block=8):
+    """
+    Evaluates a clustering metric for every frame of the full period.
+
+    "variance" is var(x) + var(y), assembled from the per-axis scans.
+    "entropy" is the Shannon entropy of the robots' distribution over a
+    coarse grid of block x block bins. Per-cell occupancy would not do: the
+    picture has hardly any robots sharing a cell, so its cell entropy is
+    near the maximum, whereas bunching the robots into few bins lowers the
+    bin entropy. Frames are simulated in batches whose bincount holds at
+    most batch_elements bins, which bounds memory regardless of the number
+    of frames.
+
+    Args:
+        robots (numpy.ndarray): Structured array from parse_input_array.
+        width (int): Width of the grid (for wrapping).
+        height (int): Height of the grid (for wrapping).
+        metric (str): "variance" or "entropy".
+        batch_elements (int): Upper bound on array elements held at once.
+        block (int): Bin side length for the entropy metric.
+
+    Returns:
+        numpy.ndarray: Metric for t = 0 .. width * height - 1; the picture is
+        the frame with the lowest value.
+    """
+    frames = width * height
+    times = np.arange(frames)
+    if metric == "variance":
+        var_x = axis_variances(robots["x"], robots["vx"], width, batch_elements)
+        var_y = axis_variances(robots["y"], robots["vy"], height, batch_elements)
+        return var_x[times % width] + var_y[times % height]
+    if metric != "entropy":
+        raise ValueError(f"Unknown metric: {metric}")
+
+    count = len(robots)
+    bins_y = -(-height // block)
+    bins = -(-width // block) * bins_y
+    entropy = np.empty(frames)
+    batch = max(1, batch_elements // max(bins, count))
+    for first in range(0, frames, batch):
+        t = np.arange(first, min(first + batch, frames))[:, None]
+        x, y = compute_positions_array(robots, t, width, height)
+        # One bincount over (frame, bin) pairs gives every frame's histogram
+        frame_bins = (t - first) * bins + (x // block) * bins_y + y // block
+        occupancy = np.bincount(frame_bins.ravel(), minlength=len(t) * bins)
+        occupied = np.flatnonzero(occupancy)
+        c = occupancy[occupied]
+        # H = log(n) - sum(c * log c) / n over the occupied bins of a frame
+        weighted = np.bincount(occupied // bins, weights=c * np.log(c), minlength=len(t))
+        entropy[first:first + len(t)] = np.log(count) - weighted / count
+    return entropy
+
+def main(file_path='input.txt', engine=None, scan=False, metric="variance"):
+    """
+    Prints the safety factor after 100 seconds, or with scan=True the first
+    time the robots form the picture.
+    engine is "array" (NumPy) or "tuple" (reference); by default the array
+    path is used when NumPy is available.
+    """
     # Define grid size based on problem statement
     width = 101   # x ranges from 0 to 100
     height = 103  # y ranges from 0 to 102
@@ -101,18 +278,36 @@ def main():
     # Time after which to calculate safety factor
     t = 100
 
+    if engine is None:
+        engine = "array" if np is not None else "tuple"
+
     # Parse the input file
-    robots = parse_input('input.txt')
+    robots = parse_input_array(file_path) if engine == "array" or scan else parse_input(file_path)
 
-    if not robots:
+    if len(robots) == 0:
         print("No robots found in the input.")
         return
 
+    if scan:
+        if metric == "variance":
+            print(find_pattern_time(robots, width, height))
+        else:
+            print(int(np.argmin(scan_frames(robots, width, height, metric))))
+        return
+
     # Calculate the safety factor
-    safety_factor = calculate_safety_factor(robots, t, width, height)
+    if engine == "array":
+        safety_factor = calculate_safety_factor_array(robots, t, width, height)
+    else:
+        safety_factor = calculate_safety_factor(robots, t, width, height)
 
     # Output the result
     print(safety_factor)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engine", choices=("array", "tuple"))
+    parser.add_argument("--scan", action="store_true", help="find the picture frame instead")
+    parser.add_argument("--metric", choices=("variance", "entropy"), default="variance")
+    args = parser.parse_args()
+    main(engine=args.engine, scan=args.scan, metric=args.metric)
@@ -0,0 +1,292 @@
+"""
+Seeded synthetic input generators, one per day, for stress benchmarking.
+
+Every generator takes a random.Random and a size and returns the input text in
+that day's puzzle format. The meaning of size depends on the day: the number
+of lines/records for list-like inputs, or the side length for grid inputs.
+
+Usage:
+    python generate_input.py 06 --size 1000 --seed 7 -o big_map.txt
+"""
+import argparse
+import random
+import string
+import sys
+
+
+def generate_day01(rng, size):
+    # size: number of location ID pairs. The right column reuses left IDs
+    # often enough that the similarity score is not trivially zero.
+    left = [rng.randint(10000, 99999) for _ in range(size)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999)
+             for _ in range(size)]
+    return "\n".join(f"{a}   {b}" for a, b in zip(left, right))
+
+
+def generate_day02(rng, size):
+    # size: number of reports. Roughly half are safe, the rest have one or
+    # more bad levels.
+    lines = []
+    for _ in range(size):
+        length = rng.randint(5, 8)
+        step = 1 if rng.random() < 0.5 else -1
+        level = rng.randint(30, 70)
+        report = [level]
+        for _ in range(length - 1):
+            level += step * rng.randint(1, 3)
+            report.append(level)
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            report[rng.randrange(length)] += rng.randint(-4, 4)
+        lines.append(" ".join(map(str, report)))
+    return "\n".join(lines)
+
+
+def generate_day03(rng, size):
+    # size: number of real instructions, embedded in junk that includes
+    # near-miss fragments.
+    junk = ["mul(", "mul[3,7]", "mul ( 2, 4 )", "do(", "don't", "mul(4*", "mul(6,9!",
+            "?(12,34)", "what()", "select()", "from()", "how(", ")", "'", ","]
+    filler = string.ascii_letters + string.digits + "!@#$%^&*()[]{}<>,;:'?+-_ "
+    parts = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.8:
+            parts.append(f"mul({rng.randint(0, 999)},{rng.randint(0, 999)})")
+        elif roll < 0.9:
+            parts.append("do()")
+        else:
+            parts.append("don't()")
+        if rng.random() < 0.5:
+            parts.append(rng.choice(junk))
+        parts.append("".join(rng.choice(filler) for _ in range(rng.randint(0, 8))))
+    return "".join(parts)
+
+
+def generate_day04(rng, size):
+    # size: side length of the letter grid.
+    return "\n".join("".join(rng.choice("XMAS") for _ in range(size)) for _ in range(size))
+
+
+def generate_day05(rng, size):
+    # size: number of updates. The page set grows with size; rules cover
+    # every pair of pages and follow one random total order, so every update
+    # can be repaired.
+    page_count = min(49 + size // 100, 900)
+    pages = rng.sample(range(10, 1000), page_count)
+    rules = [f"{pages[i]}|{pages[j]}"
+             for i in range(page_count) for j in range(i + 1, page_count)]
+    rng.shuffle(rules)
+    rank = {page: idx for idx, page in enumerate(pages)}
+    updates = []
+    for _ in range(size):
+        length = rng.randrange(5, 24, 2)
+        update = rng.sample(pages, length)
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def _guard_walk(grid, r, c):
+    # Walks the guard from (r, c) heading up; returns the number of steps
+    # before it leaves the map, or None if it gets stuck in a loop.
+    size = len(grid)
+    steps = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    d = 0
+    seen = set()
+    while (r, c, d) not in seen:
+        seen.add((r, c, d))
+        fr, fc = r + steps[d][0], c + steps[d][1]
+        if not (0 <= fr < size and 0 <= fc < size):
+            return len(seen)
+        if grid[fr][fc] == "#":
+            d = (d + 1) % 4
+        else:
+            r, c = fr, fc
+    return None
+
+
+def generate_day06(rng, size):
+    # size: side length of the guard map, about 10% obstacles. Like the real
+    # puzzles, the guard starts somewhere it eventually walks off the map; of
+    # 1000 random starts the one with the longest walk is kept, since a long
+    # path is what leaves many cells where an obstacle makes a loop.
+    grid = [["#" if rng.random() < 0.1 else "." for _ in range(size)] for _ in range(size)]
+    best = best_start = None
+    for _ in range(1000):
+        r, c = rng.randrange(size), rng.randrange(size)
+        if grid[r][c] == ".":
+            steps = _guard_walk(grid, r, c)
+            if steps is not None and (best is None or steps > best):
+                best, best_start = steps, (r, c)
+    if best_start is None:
+        raise ValueError(f"No start found from which the guard leaves the {size}x{size} map")
+    r, c = best_start
+    grid[r][c] = "^"
+    return "\n".join("".join(row) for row in grid)
+
+
+def generate_day07(rng, size):
+    # size: number of equations. About half the targets are reachable.
+    lines = []
+    for _ in range(size):
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        value = nums[0]
+        for num in nums[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                value += num
+            elif op == "*":
+                value *= num
+            else:
+                value = int(f"{value}{num}")
+        if rng.random() < 0.5:
+            value += rng.randint(1, 9)
+        lines.append(f"{value}: {' '.join(map(str, nums))}")
+    return "\n".join(lines)
+
+
+def generate_day08(rng, size):
+    # size: side length of the antenna map, about four antennas per frequency.
+    symbols = string.digits + string.ascii_letters
+    grid = [["."] * size for _ in range(size)]
+    for _ in range(max(1, size * size // 50)):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(symbols)
+    return "\n".join("".join(row) for row in grid)
+
+
+def generate_day09(rng, size):
+    # size: number of files in the disk map.
+    digits = []
+    for i in range(size):
+        digits.append(str(rng.randint(1, 9)))
+        if i != size - 1:
+            digits.append(str(rng.randint(0, 9)))
+    return "".join(digits)
+
+
+def generate_day10(rng, size):
+    # size: side length of the topographic map. Random heights with uphill
+    # trails carved into them so that trailheads actually reach 9s.
+    grid = [[rng.randint(0, 9) for _ in range(size)] for _ in range(size)]
+    steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    for _ in range(max(1, size * size // 12)):
+        r, c = rng.randrange(size), rng.randrange(size)
+        for height in range(10):
+            grid[r][c] = height
+            dr, dc = rng.choice(steps)
+            r = min(max(r + dr, 0), size - 1)
+            c = min(max(c + dc, 0), size - 1)
+    return "\n".join("".join(map(str, row)) for row in grid)
+
+
+def generate_day11(rng, size):
+    # size: number of initial stones.
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(size))
+
+
+def generate_day12(rng, size):
+    # size: side length of the garden. Letters come from a coarse block grid
+    # with jittered lookups, which gives irregular, multi-cell regions.
+    block = 4
+    coarse_size = size // block + 2
+    coarse = [[rng.choice(string.ascii_uppercase) for _ in range(coarse_size)]
+              for _ in range(coarse_size)]
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            row.append(coarse[(r + rng.randint(0, 2)) // block][(c + rng.randint(0, 2)) // block])
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+def generate_day13(rng, size):
+    # size: number of claw machines. Mixes small solvable prizes, prizes
+    # solvable only after the 10^13 offset, unsolvable ones and a few
+    # machines whose buttons are parallel (determinant zero).
+    offset = 10 ** 13
+    blocks = []
+    for _ in range(size):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        if rng.random() < 0.05:
+            factor = rng.randint(2, 4)
+            bx, by = ax * factor, ay * factor
+        else:
+            bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        roll = rng.random()
+        if roll < 0.3:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        elif roll < 0.6:
+            a = rng.randint(offset // 100, offset // 10)
+            b = rng.randint(offset // 100, offset // 10)
+            px, py = a * ax + b * bx - offset, a * ay + b * by - offset
+            if px < 0 or py < 0:
+                px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\n"
+                      f"Button B: X+{bx}, Y+{by}\n"
+                      f"Prize: X={px}, Y={py}")
+    return "\n\n".join(blocks)
+
+
+def generate_day14(rng, size, width=101, height=103):
+    # size: number of robots on the standard 101x103 floor.
+    lines = []
+    for _ in range(size):
+        x, y = rng.randrange(width), rng.randrange(height)
+        vx, vy = rng.randint(-width + 1, width - 1), rng.randint(-height + 1, height - 1)
+        lines.append(f"p={x},{y} v={vx},{vy}")
+    return "\n".join(lines)
+
+
+GENERATORS = {
+    "01": generate_day01,
+    "02": generate_day02,
+    "03": generate_day03,
+    "04": generate_day04,
+    "05": generate_day05,
+    "06": generate_day06,
+    "07": generate_day07,
+    "08": generate_day08,
+    "09": generate_day09,
+    "10": generate_day10,
+    "11": generate_day11,
+    "12": generate_day12,
+    "13": generate_day13,
+    "14": generate_day14,
+}
+
+
+def generate(day, size, seed=0):
+    """
+    Returns a synthetic input for the given day ("01".."14") as a string.
+    The same (day, size, seed) always produces the same text.
+    """
+    day = f"{int(day):02d}"
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](random.Random(seed), size) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic puzzle inputs.")
+    parser.add_argument("day", help="day number, e.g. 06")
+    parser.add_argument("--size", type=int, default=1000,
+                        help="records for list inputs, side length for grid inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    text = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Flat character grid shared by the grid puzzles.
+
+A Grid stores the map row-major in one bytearray with a one-cell sentinel
+border all around, so a cell is a single int index, its neighbors are fixed
+index offsets, and walking off the map lands on a sentinel instead of
+needing a bounds check:
+
+    grid = Grid.from_file("input.txt")
+    for i in grid.find_all("0"):
+        for offset in grid.neighbors4:
+            if grid.data[i + offset] == ord("1"):
+                ...
+
+Cells hold the input bytes unchanged (b"0"..b"9" for digit maps); the
+sentinel defaults to 0, which no input character uses. Solvers can move onto
+it one at a time: Grid.from_lines accepts the lists they already build.
+"""
+import mmap
+import os
+
+
+def _row_spans(buffer):
+    # Yields (start, end) of each non-empty line, without the line ending
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        stop = end
+        if stop > start and buffer[stop - 1] == 13:  # "\r"
+            stop -= 1
+        if stop > start:
+            yield start, stop
+        start = end + 1
+
+
+def _map_file(path):
+    # mmap cannot map an empty file
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Grid:
+    """
+    Row-major byte grid with a sentinel border.
+
+    data holds (rows + 2) * width bytes where width = cols + 2; map cell
+    (r, c) is at flat index (r + 1) * width + c + 1. neighbors4 lists the
+    offsets of the up, right, down and left neighbors (clockwise from up).
+    """
+
+    def __init__(self, data, rows, cols, sentinel=0):
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.sentinel = sentinel
+        width = self.width
+        self.neighbors4 = (-width, 1, width, -1)
+
+    @classmethod
+    def from_lines(cls, lines, sentinel=0):
+        """
+        Builds a grid from equal-length rows given as str, bytes or lists of
+        single characters.
+        """
+        rows = []
+        for line in lines:
+            if isinstance(line, list):
+                line = "".join(line)
+            if isinstance(line, str):
+                line = line.encode()
+            rows.append(line)
+        return cls._from_rows(rows, sentinel)
+
+    @classmethod
+    def from_file(cls, path, sentinel=0):
+        """
+        Loads a grid from a text file. The file is memory-mapped and its rows
+        are copied into the flat buffer through a memoryview, so no per-line
+        strings or bytes objects are created.
+        """
+        buffer = _map_file(path)
+        try:
+            with memoryview(buffer) as view:
+                return cls._from_rows((view[start:stop] for start, stop in _row_spans(buffer)),
+                                      sentinel)
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    @classmethod
+    def _from_rows(cls, rows, sentinel):
+        data = None
+        count = cols = 0
+        edge = bytes((sentinel,))
+        for row in rows:
+            if data is None:
+                cols = len(row)
+                data = bytearray(edge * (cols + 2))
+            elif len(row) != cols:
+                raise ValueError(f"Row {count} has {len(row)} cells, expected {cols}")
+            data += edge
+            data += row
+            data += edge
+            count += 1
+        if data is None:
+            data = bytearray(edge * 2)
+        data += edge * (cols + 2)
+        return cls(data, count, cols, sentinel)
+
+    def position(self, i):
+        """
+        Returns the (row, column) of flat index i.
+        """
+        r, c = divmod(i, self.width)
+        return r - 1, c - 1
+
+    def find_all(self, value):
+        """
+        Returns the flat indices of every cell holding value.
+        """
+        if isinstance(value, str):
+            value = value.encode()
+        found = []
+        i = self.data.find(value, self.width)
+        while i != -1:
+            found.append(i)
+            i = self.data.find(value, i + 1)
+        return found
+
+
+def grid_shape(path):
+    """
+    Returns (rows, cols) of a grid file without building the grid.
+    """
+    buffer = _map_file(path)
+    try:
+        rows = cols = 0
+        for start, stop in _row_spans(buffer):
+            cols = cols or stop - start
+            rows += 1
+        return rows, cols
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()